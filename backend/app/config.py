@@ -90,9 +90,17 @@ class Settings(BaseSettings):
     cache_ttl: int = Field(default=300, validation_alias="CACHE_TTL")
     cache_ttl_short: int = Field(default=60, validation_alias="CACHE_TTL_SHORT")
     cache_ttl_long: int = Field(default=3600, validation_alias="CACHE_TTL_LONG")
+    # Extra time a compiled resume may be served stale while it is refreshed
+    cache_stale_window: int = Field(default=300, validation_alias="CACHE_STALE_WINDOW")
     
     # PDF settings
     max_resume_pages: int = Field(default=1, validation_alias="MAX_RESUME_PAGES")
+    # Worker processes for multi-page PDF text extraction on upload (<2 disables)
+    pdf_parse_workers: int = Field(default=4, validation_alias="PDF_PARSE_WORKERS")
+    
+    # Startup
+    # Warm frontend/Groq connections and the PDF renderer in the background after startup (off by default)
+    startup_warmup: bool = Field(default=False, validation_alias="STARTUP_WARMUP")
     
     # Monitoring
     sentry_dsn: str = Field(default="", validation_alias="SENTRY_DSN")
@@ -3,6 +3,7 @@ FastAPI Main Application Entry Point
 MatchQuill Resume Compiler API
 """
 
+import asyncio
 import time
 import psutil
 import sentry_sdk
@@ -121,6 +122,20 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             clear_request_context()
 
 
+async def _run_startup_warmups(settings) -> None:
+    """Warm shared connections and the PDF renderer; each warm-up logs and swallows its own errors."""
+    from app.services.profile_service import warm_shared_http_client
+    from app.services.groq_client import get_groq_client
+    warmups = [warm_shared_http_client()]
+    if settings.groq_api_key:
+        warmups.append(get_groq_client().warm_up())
+    from app.utils import PDF_AVAILABLE
+    if PDF_AVAILABLE:
+        from app.utils.pdf_generator import warm_up_pdf_generator
+        warmups.append(warm_up_pdf_generator())
+    await asyncio.gather(*warmups, return_exceptions=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
@@ -145,15 +160,39 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("[STARTUP] Audit retention init skipped", {"error": str(e)})
     
+    # Optionally open the shared frontend and Groq connections (and warm the
+    # PDF renderer) in the background so the first request doesn't pay for
+    # pool setup, the TCP + TLS handshake, or font loading; startup never
+    # waits on any of them
+    warmup_task = None
+    if settings.startup_warmup:
+        warmup_task = asyncio.create_task(_run_startup_warmups(settings))
+    
     yield
     
     # Shutdown
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+    
     await redis_client.close()
     
     # Close shared HTTP client
     from app.services.profile_service import close_shared_http_client
     await close_shared_http_client()
     
+    # Close shared Groq client (aiohttp session when groq[aiohttp] is installed)
+    from app.services.groq_client import close_groq_client
+    await close_groq_client()
+    
+    # Close the parser's AsyncGroq client and stop PDF text worker processes
+    from app.services.resume_parser import close_groq_client as close_parser_groq_client, close_pdf_text_pool
+    await close_parser_groq_client()
+    close_pdf_text_pool()
+    
     logger.info("[SHUTDOWN] MatchQuill API shutdown complete")
 
 
@@ -21,8 +21,12 @@ security = HTTPBearer(auto_error=False)
 
 # Short-lived cache for DB-validated tokens to avoid a frontend/session
 # round-trip on every expensive AI/upload request. Keyed by token hash only.
+# Entries live until the JWT's own ``exp`` (signature already verified
+# locally), capped so session-side revocation is picked up reasonably soon;
+# tokens without ``exp`` fall back to the short default TTL.
 _DB_AUTH_CACHE: Dict[str, Tuple[str, float]] = {}
 _DB_AUTH_CACHE_TTL_SECONDS = 60.0
+_DB_AUTH_CACHE_MAX_TTL_SECONDS = 900.0
 _DB_AUTH_CACHE_MAX_SIZE = 1024
 
 
@@ -44,7 +48,17 @@ def _get_cached_user_id(token: str) -> Optional[str]:
     return user_id
 
 
-def _set_cached_user_id(token: str, user_id: str) -> None:
+def _cache_ttl_for_claims(payload: dict) -> float:
+    """TTL for a validated token: until its ``exp``, capped; default if absent."""
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return _DB_AUTH_CACHE_TTL_SECONDS
+    return max(0.0, min(exp - time.time(), _DB_AUTH_CACHE_MAX_TTL_SECONDS))
+
+
+def _set_cached_user_id(
+    token: str, user_id: str, ttl: float = _DB_AUTH_CACHE_TTL_SECONDS
+) -> None:
     """Cache validated user_id with TTL; bound cache size."""
     if len(_DB_AUTH_CACHE) >= _DB_AUTH_CACHE_MAX_SIZE:
         # Drop expired entries first; if still full, clear all
@@ -56,7 +70,7 @@ def _set_cached_user_id(token: str, user_id: str) -> None:
             _DB_AUTH_CACHE.clear()
     _DB_AUTH_CACHE[_token_cache_key(token)] = (
         user_id,
-        time.monotonic() + _DB_AUTH_CACHE_TTL_SECONDS,
+        time.monotonic() + ttl,
     )
 
 
@@ -131,7 +145,8 @@ async def verify_auth_token_with_db(
     session soft-check as "user not found" was a production bug that blocked
     resume upload after secrets were aligned.
 
-    Results are cached briefly (by token hash) to avoid repeat work on
+    Results are cached (by token hash) until the token expires, at most
+    15 minutes, so the session round-trip isn't repeated on
     high-frequency AI/upload routes.
     """
     if credentials is None:
@@ -201,7 +216,7 @@ async def verify_auth_token_with_db(
                     "user_id": user_id,
                 })
 
-            _set_cached_user_id(token, user_id)
+            _set_cached_user_id(token, user_id, _cache_ttl_for_claims(payload))
             return user_id
 
         finally:
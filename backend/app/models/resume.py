@@ -17,6 +17,9 @@ TemplateType = Literal[
     "compact-technical",
 ]
 
+# What /compile should produce: "json" skips PDF rendering (e.g. previews)
+ResumeOutputFormat = Literal["json", "both"]
+
 
 class ResumeRequest(BaseModel):
     """Request body for resume compilation endpoint."""
@@ -41,6 +44,11 @@ class ResumeRequest(BaseModel):
         default=None,
         description="Template to use. If not provided, uses user's saved preference.",
     )
+    output_format: ResumeOutputFormat = Field(
+        default="both",
+        alias="outputFormat",
+        description="'both' returns resume JSON and PDF; 'json' skips PDF generation.",
+    )
     ats_type: Optional[str] = Field(
         default=None,
         alias="atsType",
@@ -5,15 +5,17 @@ Endpoints for LLM-powered resume helpers (bullet enhancement, interview prep, sk
 All routes require authentication and are rate-limited to control LLM cost and abuse.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.middleware.auth import verify_auth_token_with_db
-from app.services.groq_client import GroqClient
+from app.services.groq_client import get_groq_client
 from app.utils.logger import logger
 from app.utils.rate_limiter import RateLimitConfig, limiter
+from app.utils.sse import sse_event
 
 router = APIRouter(prefix="/ai")
 
@@ -23,6 +25,15 @@ class EnhanceBulletRequest(BaseModel):
     job_description: Optional[str] = Field(default=None, max_length=20000)
 
 
+# Batch size matches the per-minute single-bullet quota
+MAX_BATCH_BULLETS = 10
+
+
+class EnhanceBulletsRequest(BaseModel):
+    bullets: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_BULLETS)
+    job_description: Optional[str] = Field(default=None, max_length=20000)
+
+
 class InterviewPrepRequest(BaseModel):
     candidate_info: str = Field(..., min_length=1, max_length=50000)
     job_description: Optional[str] = Field(default=None, max_length=50000)
@@ -69,7 +80,7 @@ async def enhance_bullet(
     """Rewrite a resume bullet point to be more impactful and relevant."""
     logger.info("[AI] Enhancing bullet", {"user_id": user_id})
     try:
-        client = GroqClient()
+        client = get_groq_client()
         enhanced_bullet = await client.enhance_bullet(
             bullet=body.bullet,
             job_description=body.job_description,
@@ -82,6 +93,32 @@ async def enhance_bullet(
         raise HTTPException(status_code=500, detail="Failed to enhance bullet") from e
 
 
+@router.post("/enhance-bullets")
+@_apply_limit(RateLimitConfig.AI_ENHANCE_BULLETS)
+async def enhance_bullets(
+    request: Request,
+    body: EnhanceBulletsRequest,
+    user_id: str = Depends(verify_auth_token_with_db),
+) -> dict:
+    """Rewrite several resume bullets concurrently in a single request."""
+    if any(not bullet.strip() or len(bullet) > 2000 for bullet in body.bullets):
+        raise HTTPException(status_code=400, detail="Each bullet must be 1-2000 characters")
+
+    logger.info("[AI] Enhancing bullets", {"user_id": user_id, "count": len(body.bullets)})
+    try:
+        client = get_groq_client()
+        enhanced_bullets = await client.enhance_bullets(
+            bullets=body.bullets,
+            job_description=body.job_description,
+        )
+        return {"enhanced_bullets": enhanced_bullets}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error enhancing bullets", {"user_id": user_id, "error": str(e)})
+        raise HTTPException(status_code=500, detail="Failed to enhance bullets") from e
+
+
 @router.post("/interview-prep", response_model=InterviewPrepResponse)
 @_apply_limit(RateLimitConfig.AI_INTERVIEW_PREP)
 async def interview_prep(
@@ -92,7 +129,7 @@ async def interview_prep(
     """Generate interview questions and answers based on candidate info and job desc."""
     logger.info("[AI] Generating interview prep", {"user_id": user_id})
     try:
-        client = GroqClient()
+        client = get_groq_client()
         questions = await client.generate_interview_prep(
             candidate_info=body.candidate_info,
             job_description=body.job_description,
@@ -105,6 +142,43 @@ async def interview_prep(
         raise HTTPException(status_code=500, detail="Failed to generate interview prep") from e
 
 
+@router.post("/interview-prep/stream")
+@_apply_limit(RateLimitConfig.AI_INTERVIEW_PREP)
+async def stream_interview_prep(
+    request: Request,
+    body: InterviewPrepRequest,
+    user_id: str = Depends(verify_auth_token_with_db),
+) -> StreamingResponse:
+    """
+    Stream interview questions as server-sent events.
+
+    Emits a ``question`` event per completed question object, then ``done``
+    with the total count, or ``error`` on failure.
+    """
+    logger.info("[AI] Streaming interview prep", {"user_id": user_id})
+    client = get_groq_client()
+
+    async def events() -> AsyncIterator[str]:
+        count = 0
+        try:
+            async for question in client.stream_interview_prep(
+                candidate_info=body.candidate_info,
+                job_description=body.job_description,
+            ):
+                count += 1
+                yield sse_event("question", question)
+            yield sse_event("done", {"count": count})
+        except Exception as e:
+            logger.error("Error streaming interview prep", {"user_id": user_id, "error": str(e)})
+            yield sse_event("error", {"error": "Failed to generate interview prep"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/suggest-skills", response_model=SkillSuggestionResponse)
 @_apply_limit(RateLimitConfig.AI_SUGGEST_SKILLS)
 async def suggest_skills(
@@ -118,7 +192,7 @@ async def suggest_skills(
         raise HTTPException(status_code=400, detail="Experience text too short")
 
     try:
-        client = GroqClient()
+        client = get_groq_client()
         skills = await client.suggest_skills(body.experience_text)
         return {"skills": skills}
     except HTTPException:
@@ -109,6 +109,7 @@ async def compile_resume(
         "template": resume_request.template,
         "auth_source": auth_source,
         "ats_type": resume_request.ats_type,
+        "output_format": resume_request.output_format,
     })
     
     try:
@@ -146,7 +147,25 @@ async def compile_resume(
                 detail="Profile is empty. Please add experiences, projects, or skills before generating a resume.",
             )
         
-        # Compile resume
+        # Cache hit: send the stored JSON as-is, skipping model validation
+        # and response_model re-serialization
+        cached_json = await compiler.get_cached_response_json(
+            profile,
+            resume_request.job_description,
+            template=resume_request.template,
+            output_format=resume_request.output_format,
+        )
+        if cached_json is not None:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.end_operation("compile_resume", duration_ms, {
+                "request_id": request_id,
+                "user_id": profile.id,
+                "cached": True,
+            })
+            return Response(content=cached_json, media_type="application/json")
+
+        # Compile resume; the cache was just checked above, so skip the
+        # second read and only store the result
         logger.info("Starting resume compilation", {
             "request_id": request_id,
             "user_id": profile.id,
@@ -157,6 +176,8 @@ async def compile_resume(
             profile=profile,
             job_description=resume_request.job_description,
             template=resume_request.template,
+            output_format=resume_request.output_format,
+            refresh=True,
         )
         
         duration_ms = (time.time() - start_time) * 1000
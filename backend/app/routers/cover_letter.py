@@ -4,14 +4,18 @@ API endpoint for generating tailored cover letters.
 """
 
 import time
+from typing import AsyncIterator
 from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.models.cover_letter import CoverLetterRequest, CoverLetterResponse
+from app.models.user import UserProfile
 from app.services.profile_service import ProfileService
 from app.services.cover_letter_generator import CoverLetterGenerator
 from app.utils.logger import logger, get_request_id, log_auth_operation
 from app.utils.rate_limiter import limiter, RateLimitConfig
+from app.utils.sse import sse_event
 
 
 router = APIRouter()
@@ -63,21 +67,18 @@ def get_auth_token(
     )
 
 
-@router.post("/cover-letter", response_model=CoverLetterResponse)
-@limiter.limit(RateLimitConfig.GENERATE_COVER_LETTER)
-async def generate_cover_letter(
-    request: Request,
+async def _load_cover_letter_profile(
     cover_request: CoverLetterRequest,
-    auth_token: str = Depends(get_auth_token),
-    profile_service: ProfileService = Depends(get_profile_service),
-    generator: CoverLetterGenerator = Depends(get_cover_letter_generator),
-) -> CoverLetterResponse:
+    auth_token: str,
+    profile_service: ProfileService,
+    request_id: str,
+) -> UserProfile:
     """
-    Generate a tailored cover letter based on user profile and job description.
+    Run the request checks shared by the cover letter routes.
+
+    Validates the job description length, fetches the profile, and checks
+    the profile data and tone. Raises HTTPException (400/401) on failure.
     """
-    request_id = get_request_id()
-    start_time = time.time()
-    
     # Validate job description length
     job_description_length = len(cover_request.job_description)
     if job_description_length < 50:
@@ -100,10 +101,76 @@ async def generate_cover_letter(
             detail=f"Job description is too long ({job_description_length} characters). Maximum allowed: 50,000 characters.",
         )
     
+    # Validate auth token and get user profile
+    logger.info("Fetching user profile for cover letter", {"request_id": request_id})
+    profile = await profile_service.get_profile(auth_token)
+    
+    if profile is None:
+        logger.warning("Cover letter auth failed - invalid token", {"request_id": request_id})
+        log_auth_operation("cover_letter:auth_failed", success=False)
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or expired authentication token",
+        )
+    
+    logger.info("Profile fetched for cover letter", {
+        "request_id": request_id,
+        "user_id": profile.id,
+        "experiences_count": len(profile.experiences) if profile.experiences else 0,
+        "skills_count": len(profile.skills) if profile.skills else 0,
+    })
+    
+    log_auth_operation("cover_letter:auth_success", user_id=profile.id, success=True)
+    
+    # Check if profile has sufficient data
+    if not profile.experiences and not profile.skills:
+        logger.warning("Insufficient profile data for cover letter", {
+            "request_id": request_id,
+            "user_id": profile.id,
+        })
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "Profile needs at least some experiences or skills "
+                "to generate a meaningful cover letter."
+            ),
+        )
+    
+    # Validate tone
+    valid_tones = {"professional", "enthusiastic", "formal"}
+    if cover_request.tone and cover_request.tone not in valid_tones:
+        logger.warning("Invalid tone specified", {
+            "request_id": request_id,
+            "tone": cover_request.tone,
+            "valid_tones": list(valid_tones),
+        })
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid tone. Must be one of: {', '.join(valid_tones)}",
+        )
+    
+    return profile
+
+
+@router.post("/cover-letter", response_model=CoverLetterResponse)
+@limiter.limit(RateLimitConfig.GENERATE_COVER_LETTER)
+async def generate_cover_letter(
+    request: Request,
+    cover_request: CoverLetterRequest,
+    auth_token: str = Depends(get_auth_token),
+    profile_service: ProfileService = Depends(get_profile_service),
+    generator: CoverLetterGenerator = Depends(get_cover_letter_generator),
+) -> CoverLetterResponse:
+    """
+    Generate a tailored cover letter based on user profile and job description.
+    """
+    request_id = get_request_id()
+    start_time = time.time()
+    
     auth_source = "header" if auth_token != cover_request.auth_token else "body"
     logger.start_operation("generate_cover_letter", {
         "request_id": request_id,
-        "job_description_length": job_description_length,
+        "job_description_length": len(cover_request.job_description),
         "tone": cover_request.tone,
         "max_words": cover_request.max_words,
         "auth_source": auth_source,
@@ -111,53 +178,9 @@ async def generate_cover_letter(
     })
     
     try:
-        # Validate auth token and get user profile
-        logger.info("Fetching user profile for cover letter", {"request_id": request_id})
-        profile = await profile_service.get_profile(auth_token)
-        
-        if profile is None:
-            logger.warning("Cover letter auth failed - invalid token", {"request_id": request_id})
-            log_auth_operation("cover_letter:auth_failed", success=False)
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid or expired authentication token",
-            )
-        
-        logger.info("Profile fetched for cover letter", {
-            "request_id": request_id,
-            "user_id": profile.id,
-            "experiences_count": len(profile.experiences) if profile.experiences else 0,
-            "skills_count": len(profile.skills) if profile.skills else 0,
-        })
-        
-        log_auth_operation("cover_letter:auth_success", user_id=profile.id, success=True)
-        
-        # Check if profile has sufficient data
-        if not profile.experiences and not profile.skills:
-            logger.warning("Insufficient profile data for cover letter", {
-                "request_id": request_id,
-                "user_id": profile.id,
-            })
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    "Profile needs at least some experiences or skills "
-                    "to generate a meaningful cover letter."
-                ),
-            )
-        
-        # Validate tone
-        valid_tones = {"professional", "enthusiastic", "formal"}
-        if cover_request.tone and cover_request.tone not in valid_tones:
-            logger.warning("Invalid tone specified", {
-                "request_id": request_id,
-                "tone": cover_request.tone,
-                "valid_tones": list(valid_tones),
-            })
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid tone. Must be one of: {', '.join(valid_tones)}",
-            )
+        profile = await _load_cover_letter_profile(
+            cover_request, auth_token, profile_service, request_id
+        )
         
         # Generate cover letter
         logger.info("Starting cover letter generation", {
@@ -194,6 +217,76 @@ async def generate_cover_letter(
         raise HTTPException(status_code=500, detail=f"Cover letter generation failed: {str(e)}")
 
 
+@router.post("/cover-letter/stream")
+@limiter.limit(RateLimitConfig.GENERATE_COVER_LETTER)
+async def stream_cover_letter(
+    request: Request,
+    cover_request: CoverLetterRequest,
+    auth_token: str = Depends(get_auth_token),
+    profile_service: ProfileService = Depends(get_profile_service),
+    generator: CoverLetterGenerator = Depends(get_cover_letter_generator),
+) -> StreamingResponse:
+    """
+    Stream a tailored cover letter as server-sent events.
+
+    Emits ``delta`` events with ``{"text": ...}`` as tokens arrive, then a
+    ``done`` event with the word count, or an ``error`` event on failure.
+    """
+    request_id = get_request_id()
+    start_time = time.time()
+    
+    auth_source = "header" if auth_token != cover_request.auth_token else "body"
+    logger.start_operation("stream_cover_letter", {
+        "request_id": request_id,
+        "job_description_length": len(cover_request.job_description),
+        "tone": cover_request.tone,
+        "max_words": cover_request.max_words,
+        "auth_source": auth_source,
+        "ats_type": cover_request.ats_type,
+    })
+    
+    try:
+        profile = await _load_cover_letter_profile(
+            cover_request, auth_token, profile_service, request_id
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        duration_ms = (time.time() - start_time) * 1000
+        logger.fail_operation("stream_cover_letter", e, {"request_id": request_id, "duration_ms": duration_ms})
+        raise HTTPException(status_code=500, detail=f"Cover letter generation failed: {str(e)}")
+    
+    async def events() -> AsyncIterator[str]:
+        parts = []
+        try:
+            async for delta in generator.stream(
+                profile=profile,
+                job_description=cover_request.job_description,
+                tone=cover_request.tone or "professional",
+                max_words=cover_request.max_words or 400,
+            ):
+                parts.append(delta)
+                yield sse_event("delta", {"text": delta})
+            word_count = len("".join(parts).split())
+            duration_ms = (time.time() - start_time) * 1000
+            logger.end_operation("stream_cover_letter", duration_ms, {
+                "request_id": request_id,
+                "user_id": profile.id,
+                "word_count": word_count,
+            })
+            yield sse_event("done", {"wordCount": word_count})
+        except Exception as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.fail_operation("stream_cover_letter", e, {"request_id": request_id, "duration_ms": duration_ms})
+            yield sse_event("error", {"error": "Cover letter generation failed"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/cover-letter/preview")
 @limiter.limit(RateLimitConfig.GET_PROFILE)  # Use moderate limits for preview
 async def preview_prompt(
@@ -245,18 +338,8 @@ async def preview_prompt(
         
         logger.info("Profile fetched for preview", {"request_id": request_id, "user_id": profile.id})
         
-        # Import scorer to get relevant items
-        from app.utils.relevance_scorer import RelevanceScorer
-        
-        scorer = RelevanceScorer(cover_request.job_description)
-        selected = scorer.select_top_items(
-            profile,
-            max_experiences=3,
-            max_projects=2,
-            max_skills=10,
-            max_education=1,
-            max_publications=1,
-        )
+        # Same selection (and limits) the generator uses for the real prompt
+        selected = generator.select_items(profile, cover_request.job_description)
         
         logger.debug("Relevance scoring complete for preview", {
             "request_id": request_id,
@@ -3,14 +3,21 @@ Cover Letter Generator Service
 Orchestrates cover letter generation using Groq LLM.
 """
 
+import asyncio
+import logging
 import time
+from typing import AsyncIterator
 
 from app.models.user import UserProfile
 from app.models.cover_letter import CoverLetterResponse
-from app.services.groq_client import GroqClient
+from app.services.groq_client import get_groq_client
 from app.utils.relevance_scorer import RelevanceScorer
-from app.utils.redis_cache import get_cached, set_cached, generate_cache_key
-from app.utils.logger import logger, get_request_id, log_cache_operation, log_llm_request
+from app.utils.redis_cache import get_cached_model, set_cached_compressed, generate_cache_key
+from app.utils.logger import logger, get_request_id, log_cache_operation
+
+
+# Profile sections reported in ``profile_fields_used`` (in response order)
+PROFILE_FIELDS = ("experiences", "projects", "skills", "educations", "publications")
 
 
 class CoverLetterGenerator:
@@ -27,9 +34,24 @@ class CoverLetterGenerator:
     
     def __init__(self):
         """Initialize cover letter generator."""
-        self.groq_client = GroqClient()
+        self.groq_client = get_groq_client()
         logger.info("CoverLetterGenerator initialized")
     
+    def select_items(self, profile: UserProfile, job_description: str) -> dict[str, list]:
+        """
+        Score the profile against the job description and keep the top items.
+        Shared by generation and the prompt preview endpoint.
+        """
+        scorer = RelevanceScorer(job_description)
+        return scorer.select_top_items(
+            profile,
+            max_experiences=3,
+            max_projects=2,
+            max_skills=10,
+            max_education=1,
+            max_publications=1,
+        )
+
     async def generate(
         self,
         profile: UserProfile,
@@ -43,6 +65,8 @@ class CoverLetterGenerator:
         """
         request_id = get_request_id()
         start_time = time.time()
+        # Checked once so DEBUG-only payloads aren't built on INFO-level deploys
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         logger.start_operation("CoverLetterGenerator.generate", {
             "request_id": request_id,
@@ -53,38 +77,35 @@ class CoverLetterGenerator:
             "use_cache": use_cache,
         })
         try:
-            # Check cache
-            if use_cache:
-                cache_key = generate_cache_key(profile.id, job_description, "cover")
-                logger.debug("Checking cache for cover letter", {"request_id": request_id, "cache_key": cache_key[:50]})
-                
-                cached = await get_cached(cache_key)
-                if cached:
-                    log_cache_operation("get", cache_key, hit=True)
-                    logger.info("Cache hit - returning cached cover letter", {"request_id": request_id, "user_id": profile.id})
-                    return CoverLetterResponse(**cached)
-                
-                log_cache_operation("get", cache_key, hit=False)
-                logger.debug("Cache miss", {"request_id": request_id})
-        
-            # Score and select relevant items
             logger.info("Starting relevance scoring for cover letter", {
                 "request_id": request_id,
                 "experiences_count": len(profile.experiences) if profile.experiences else 0,
                 "projects_count": len(profile.projects) if profile.projects else 0,
                 "skills_count": len(profile.skills) if profile.skills else 0,
             })
-            
-            scorer = RelevanceScorer(job_description)
-            selected = scorer.select_top_items(
-                profile,
-                max_experiences=3,
-                max_projects=2,
-                max_skills=10,
-                max_education=1,
-                max_publications=1,
-            )
-            
+
+            # Scoring is pure CPU and independent of the cache lookup, so run it
+            # in a worker thread while we wait on Redis. On a hit the scoring
+            # result is simply discarded.
+            scoring = asyncio.to_thread(self.select_items, profile, job_description)
+
+            if use_cache:
+                cache_key = generate_cache_key(profile.id, job_description, "cover")
+                if debug_enabled:
+                    logger.debug("Checking cache for cover letter", {"request_id": request_id, "cache_key": cache_key[:50]})
+
+                cached, selected = await asyncio.gather(get_cached_model(cache_key, CoverLetterResponse), scoring)
+                if cached:
+                    log_cache_operation("get", cache_key, hit=True)
+                    logger.info("Cache hit - returning cached cover letter", {"request_id": request_id, "user_id": profile.id})
+                    return cached
+
+                log_cache_operation("get", cache_key, hit=False)
+                if debug_enabled:
+                    logger.debug("Cache miss", {"request_id": request_id})
+            else:
+                selected = await scoring
+
             logger.info("Relevance scoring complete", {
                 "request_id": request_id,
                 "selected_experiences": len(selected["experiences"]),
@@ -93,7 +114,8 @@ class CoverLetterGenerator:
             })
             
             # Format candidate info for LLM
-            logger.debug("Formatting candidate info", {"request_id": request_id})
+            if debug_enabled:
+                logger.debug("Formatting candidate info", {"request_id": request_id})
             candidate_info = self.groq_client.format_candidate_info(
                 name=profile.name or "Candidate",
                 email=profile.email,
@@ -103,23 +125,14 @@ class CoverLetterGenerator:
                 educations=selected["educations"],
             )
             
-            logger.debug("Candidate info formatted", {
-                "request_id": request_id,
-                "candidate_info_length": len(candidate_info),
-            })
+            if debug_enabled:
+                logger.debug("Candidate info formatted", {
+                    "request_id": request_id,
+                    "candidate_info_length": len(candidate_info),
+                })
             
             # Track which fields were used
-            profile_fields_used = []
-            if selected["experiences"]:
-                profile_fields_used.append("experiences")
-            if selected["projects"]:
-                profile_fields_used.append("projects")
-            if selected["skills"]:
-                profile_fields_used.append("skills")
-            if selected["educations"]:
-                profile_fields_used.append("educations")
-            if selected["publications"]:
-                profile_fields_used.append("publications")
+            profile_fields_used = [field for field in PROFILE_FIELDS if selected.get(field)]
             
             # Generate cover letter
             logger.info("Calling Groq LLM for cover letter generation", {
@@ -137,14 +150,9 @@ class CoverLetterGenerator:
             )
             llm_duration = (time.time() - llm_start) * 1000
             
+            # Token usage is logged by GroqClient from the API's usage block;
+            # word_count here is the user-facing length of the letter.
             word_count = len(cover_letter.split())
-            log_llm_request(
-                model=model_used,
-                operation="generate_cover_letter",
-                tokens_in=len(candidate_info) + len(job_description),
-                tokens_out=word_count,
-                duration_ms=llm_duration,
-            )
             
             logger.info("Cover letter generated", {
                 "request_id": request_id,
@@ -164,10 +172,11 @@ class CoverLetterGenerator:
             
             # Cache successful result
             if use_cache:
-                logger.debug("Caching cover letter result", {"request_id": request_id})
-                await set_cached(
+                if debug_enabled:
+                    logger.debug("Caching cover letter result", {"request_id": request_id})
+                await set_cached_compressed(
                     cache_key,
-                    response.model_dump(mode="json"),
+                    response,
                 )
                 log_cache_operation("set", cache_key, hit=True)
             
@@ -191,3 +200,90 @@ class CoverLetterGenerator:
                 success=False,
                 error=f"Cover letter generation failed: {str(e)}",
             )
+
+    async def stream(
+        self,
+        profile: UserProfile,
+        job_description: str,
+        tone: str = "professional",
+        max_words: int = 400,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a tailored cover letter as text deltas.
+
+        A cached letter is yielded in one piece. A freshly streamed letter is
+        cached on completion so later (streaming or not) requests reuse it.
+        """
+        request_id = get_request_id()
+        start_time = time.time()
+        
+        logger.start_operation("CoverLetterGenerator.stream", {
+            "request_id": request_id,
+            "user_id": profile.id,
+            "job_description_length": len(job_description),
+            "tone": tone,
+            "max_words": max_words,
+        })
+        
+        try:
+            cache_key = generate_cache_key(profile.id, job_description, "cover")
+            scoring = asyncio.to_thread(self.select_items, profile, job_description)
+            cached, selected = await asyncio.gather(get_cached_model(cache_key, CoverLetterResponse), scoring)
+            if cached and cached.cover_letter:
+                log_cache_operation("get", cache_key, hit=True)
+                yield cached.cover_letter
+                duration_ms = (time.time() - start_time) * 1000
+                logger.end_operation("CoverLetterGenerator.stream", duration_ms, {
+                    "request_id": request_id,
+                    "user_id": profile.id,
+                    "cached": True,
+                })
+                return
+            
+            log_cache_operation("get", cache_key, hit=False)
+            
+            candidate_info = self.groq_client.format_candidate_info(
+                name=profile.name or "Candidate",
+                email=profile.email,
+                experiences=selected["experiences"],
+                projects=selected["projects"],
+                skills=selected["skills"],
+                educations=selected["educations"],
+            )
+            
+            parts = []
+            async for delta in self.groq_client.stream_cover_letter(
+                candidate_info=candidate_info,
+                job_description=job_description,
+                tone=tone,
+                max_words=max_words,
+            ):
+                parts.append(delta)
+                yield delta
+            
+            cover_letter = "".join(parts).strip()
+            word_count = len(cover_letter.split())
+            response = CoverLetterResponse(
+                success=True,
+                cover_letter=cover_letter,
+                word_count=word_count,
+                model_used=self.groq_client.model,
+                profile_fields_used=[field for field in PROFILE_FIELDS if selected.get(field)],
+            )
+            await set_cached_compressed(cache_key, response)
+            log_cache_operation("set", cache_key, hit=True)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            logger.end_operation("CoverLetterGenerator.stream", duration_ms, {
+                "request_id": request_id,
+                "user_id": profile.id,
+                "word_count": word_count,
+            })
+            
+        except Exception as e:
+            duration_ms = (time.time() - start_time) * 1000
+            logger.fail_operation("CoverLetterGenerator.stream", e, {
+                "request_id": request_id,
+                "duration_ms": duration_ms,
+            })
+            raise
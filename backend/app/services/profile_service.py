@@ -5,10 +5,14 @@ Uses shared HTTP client for better resource management with connection pooling.
 Includes retry with exponential backoff for transient failures.
 """
 
+import hashlib
+import json
+import logging
 import time
-from typing import Optional, TypeVar, Callable, Awaitable
+from typing import Dict, Optional, Tuple, TypeVar, Callable, Awaitable
 import asyncio
 import httpx
+from pydantic import ValidationError
 
 from app.config import get_settings
 from app.models.user import UserProfile
@@ -24,32 +28,162 @@ MAX_RETRIES = 3
 RETRY_BASE_DELAY_SEC = 0.25
 RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
 
+# Startup connection warm-up must never hold up app start for long
+WARMUP_TIMEOUT_SEC = 5.0
+
+# Profile bodies above this size are validated off the event loop
+PROFILE_THREAD_PARSE_BYTES = 256 * 1024
+
+# Short-lived cache of validated profile bodies, keyed by token hash (raw
+# tokens are never stored). Bodies rather than models are cached because
+# callers mutate relevance scores on the models they receive; the short TTL
+# bounds how long a just-edited profile can be served stale.
+_PROFILE_CACHE: Dict[str, Tuple[bytes, float]] = {}
+_PROFILE_CACHE_TTL_SECONDS = 15.0
+_PROFILE_CACHE_MAX_SIZE = 256
+
+# In-flight profile fetches keyed by token hash, so concurrent calls with the
+# same token share one HTTP request. Entries are dropped when the fetch ends.
+_inflight: Dict[str, asyncio.Task] = {}
+
 T = TypeVar("T")
 
+# Decode response bytes directly (no str decode step) when orjson is available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+def _profile_cache_key(token: str) -> str:
+    """Hash token for cache key (never store raw tokens)."""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_profile_body(key: str) -> Optional[bytes]:
+    """Return the cached profile body if still fresh."""
+    entry = _PROFILE_CACHE.get(key)
+    if entry is None:
+        return None
+    body, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _PROFILE_CACHE.pop(key, None)
+        return None
+    return body
+
+
+def _set_cached_profile_body(key: str, body: bytes) -> None:
+    """Cache a validated profile body with TTL; bound cache size."""
+    if len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX_SIZE:
+        # Drop expired entries first; if still full, clear all
+        now = time.monotonic()
+        expired = [k for k, (_, exp) in _PROFILE_CACHE.items() if now >= exp]
+        for k in expired:
+            _PROFILE_CACHE.pop(k, None)
+        if len(_PROFILE_CACHE) >= _PROFILE_CACHE_MAX_SIZE:
+            _PROFILE_CACHE.clear()
+    _PROFILE_CACHE[key] = (body, time.monotonic() + _PROFILE_CACHE_TTL_SECONDS)
+
+
+def clear_profile_cache() -> None:
+    """Clear the profile body cache (for tests)."""
+    _PROFILE_CACHE.clear()
+
+
+async def _single_flight(key: str, func: Callable[[], Awaitable[T]]) -> T:
+    """
+    Share one run of ``func`` between concurrent callers with the same key.
+
+    Callers await the shared task through asyncio.shield, so a cancelled
+    caller (e.g. a client disconnect) never cancels it for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_shared(func))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+    return await asyncio.shield(task)
+
+
+async def _run_shared(func: Callable[[], Awaitable[T]]) -> T:
+    """Run a shared call so that waiters only ever see Exception results."""
+    try:
+        return await func()
+    except asyncio.CancelledError as e:
+        raise RuntimeError("Shared request was cancelled") from e
+
+
+def _forget_inflight(key: str, task: asyncio.Task) -> None:
+    """Drop a finished single-flight entry."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark the error retrieved even if every caller has gone away
+        task.exception()
+
 
 async def get_shared_http_client() -> httpx.AsyncClient:
     """
     Get or create the shared HTTP client instance.
 
     Connection pooling (httpx.Limits) reuses TCP connections across requests
-    to reduce latency and socket churn under load.
+    to reduce latency and socket churn under load. HTTP/2 (when the h2
+    package is installed) multiplexes concurrent profile/session calls over
+    one connection.
     """
     global _http_client
+    # Fast path: no lock once the client exists
+    if _http_client is not None:
+        return _http_client
     async with _http_client_lock:
         if _http_client is None:
             _http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0, connect=10.0),
+                # Staged timeouts: a slow connect or a saturated pool fails
+                # fast (and is retried) instead of eating the read budget
+                timeout=httpx.Timeout(30.0, connect=5.0, write=10.0, pool=5.0),
                 follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
                 limits=httpx.Limits(
-                    max_keepalive_connections=20,
-                    max_connections=50,
+                    # Keep every pooled socket alive so bursts don't force
+                    # fresh TLS handshakes once they subside
+                    max_keepalive_connections=100,
+                    max_connections=100,
+                    # Stay below typical Node.js keep-alive timeouts so we
+                    # don't reuse sockets the frontend already closed
                     keepalive_expiry=30.0,
                 ),
             )
-            logger.info("[ProfileService] Shared HTTP client created with connection pool")
+            logger.info(
+                "[ProfileService] Shared HTTP client created with connection pool",
+                {"http2": _HTTP2_AVAILABLE},
+            )
     return _http_client
 
 
+async def warm_shared_http_client(timeout: float = WARMUP_TIMEOUT_SEC) -> bool:
+    """
+    Open a pooled connection to the frontend ahead of the first request.
+
+    Any HTTP response means the TCP + TLS handshake is done and the socket is
+    back in the keep-alive pool. Never raises.
+    """
+    client = await get_shared_http_client()
+    try:
+        await client.head(get_settings().effective_frontend_api_url, timeout=timeout)
+        return True
+    except Exception as e:
+        logger.warning("[ProfileService] Frontend warm-up failed", {"error": str(e)})
+        return False
+
+
 async def _with_retry(
     operation: str,
     func: Callable[[], Awaitable[T]],
@@ -132,63 +266,73 @@ class ProfileService:
         })
         
         try:
-            logger.debug("Calling frontend API for profile", {
-                "request_id": request_id,
-                "url": f"{self.base_url}/api/profile",
-            })
-            
-            async def _fetch() -> httpx.Response:
-                client = await get_shared_http_client()
-                resp = await client.get(
-                    f"{self.base_url}/api/profile",
-                    headers={
-                        "Authorization": f"Bearer {auth_token}",
-                        "Content-Type": "application/json",
-                        "X-Request-ID": request_id or "",
-                    },
+            # Back-to-back calls (compile then cover letter, retries) reuse
+            # the last validated body for this token briefly
+            cache_key = _profile_cache_key(auth_token)
+            body = _get_cached_profile_body(cache_key)
+            from_cache = body is not None
+            if from_cache:
+                duration_ms = (time.time() - start_time) * 1000
+                logger.info("Profile served from cache", {"request_id": request_id})
+            else:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Calling frontend API for profile", {
+                        "request_id": request_id,
+                        "url": f"{self.base_url}/api/profile",
+                    })
+                
+                # Concurrent calls with the same token share one HTTP request;
+                # each caller still validates its own UserProfile from the bytes
+                # because relevance scoring mutates the models in worker threads.
+                response = await _single_flight(
+                    cache_key,
+                    lambda: self._fetch_profile_response(auth_token),
                 )
-                # Raise for retryable server errors so _with_retry can back off
-                if resp.status_code in RETRYABLE_STATUS:
-                    resp.raise_for_status()
-                return resp
-
-            response = await _with_retry("get_profile", _fetch)
-            
-            duration_ms = (time.time() - start_time) * 1000
-            
-            logger.info("Frontend API response received", {
-                "request_id": request_id,
-                "status_code": response.status_code,
-                "duration_ms": round(duration_ms, 2),
-            })
-            
-            if response.status_code == 401:
-                logger.warning("Profile fetch failed - unauthorized", {
+                
+                duration_ms = (time.time() - start_time) * 1000
+                
+                logger.info("Frontend API response received", {
                     "request_id": request_id,
-                    "status_code": 401,
+                    "status_code": response.status_code,
+                    "duration_ms": round(duration_ms, 2),
                 })
-                log_auth_operation("profile:fetch", success=False, data={"reason": "unauthorized"})
-                return None
+                
+                if response.status_code == 401:
+                    logger.warning("Profile fetch failed - unauthorized", {
+                        "request_id": request_id,
+                        "status_code": 401,
+                    })
+                    log_auth_operation("profile:fetch", success=False, data={"reason": "unauthorized"})
+                    return None
+                
+                if response.status_code == 404:
+                    logger.warning("Profile not found", {
+                        "request_id": request_id,
+                        "status_code": 404,
+                    })
+                    log_auth_operation("profile:fetch", success=False, data={"reason": "not_found"})
+                    return None
+                
+                response.raise_for_status()
+                body = response.content
             
-            if response.status_code == 404:
-                logger.warning("Profile not found", {
+            # Parse + validate straight from bytes in pydantic-core (no
+            # intermediate Python dict); large payloads go to a worker thread
+            # so validation doesn't stall other requests on the event loop.
+            try:
+                if len(body) > PROFILE_THREAD_PARSE_BYTES:
+                    profile = await asyncio.to_thread(UserProfile.model_validate_json, body)
+                else:
+                    profile = UserProfile.model_validate_json(body)
+            except ValidationError as e:
+                logger.error("Profile API returned invalid profile JSON", {
                     "request_id": request_id,
-                    "status_code": 404,
+                    "error_count": e.error_count(),
                 })
-                log_auth_operation("profile:fetch", success=False, data={"reason": "not_found"})
                 return None
             
-            response.raise_for_status()
-            
-            data = response.json()
-            # Strict validation via Pydantic model (rejects unexpected shapes)
-            if not isinstance(data, dict):
-                logger.error("Profile API returned non-object JSON", {
-                    "request_id": request_id,
-                    "type": type(data).__name__,
-                })
-                return None
-            profile = UserProfile(**data)
+            if not from_cache:
+                _set_cached_profile_body(cache_key, body)
             
             logger.end_operation("ProfileService.get_profile", duration_ms, {
                 "request_id": request_id,
@@ -220,6 +364,27 @@ class ProfileService:
             })
             return None
     
+    async def _fetch_profile_response(self, auth_token: str) -> httpx.Response:
+        """GET /api/profile with retry on transient failures."""
+        request_id = get_request_id()
+
+        async def _fetch() -> httpx.Response:
+            client = await get_shared_http_client()
+            resp = await client.get(
+                f"{self.base_url}/api/profile",
+                headers={
+                    "Authorization": f"Bearer {auth_token}",
+                    "Content-Type": "application/json",
+                    "X-Request-ID": request_id or "",
+                },
+            )
+            # Raise for retryable server errors so _with_retry can back off
+            if resp.status_code in RETRYABLE_STATUS:
+                resp.raise_for_status()
+            return resp
+
+        return await _with_retry("get_profile", _fetch)
+    
     async def validate_token(self, auth_token: str) -> Optional[str]:
         """
         Soft-check a service JWT against the Next.js app.
@@ -241,10 +406,11 @@ class ProfileService:
         })
         
         try:
-            logger.debug("Validating auth token via frontend session API", {
-                "request_id": request_id,
-                "url": f"{self.base_url}/api/auth/session",
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Validating auth token via frontend session API", {
+                    "request_id": request_id,
+                    "url": f"{self.base_url}/api/auth/session",
+                })
             
             client = await get_shared_http_client()
             response = await client.get(
@@ -268,7 +434,7 @@ class ProfileService:
             # NextAuth returns bare `null` when there is no cookie session
             # (Bearer service JWTs never create a cookie session).
             try:
-                session = response.json()
+                session = _json_loads(response.content)
             except Exception:
                 logger.warning("Token validation: non-JSON session body", {
                     "request_id": request_id,
@@ -3,20 +3,28 @@ Resume Compiler Service
 Orchestrates the resume compilation process.
 """
 
+import asyncio
+import logging
 import time
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from app.models.user import UserProfile
-from app.models.resume import CompiledResume, TemplateType, ResumeResponse
+from app.models.resume import CompiledResume, TemplateType, ResumeOutputFormat, ResumeResponse
 from app.utils.relevance_scorer import RelevanceScorer
 from app.utils import PDFGenerator, PDF_AVAILABLE
-from app.utils.redis_cache import get_cached, set_cached, generate_cache_key
+from app.utils.redis_cache import (
+    get_cached_json_with_ttl,
+    get_cached_model_with_ttl,
+    set_cached,
+    generate_cache_key,
+)
 from app.config import get_settings
 from app.utils.logger import logger, get_request_id, log_cache_operation
 
 
 # Template configurations defining what sections to include and limits
-TEMPLATE_CONFIGS = {
+_TEMPLATE_CONFIGS = {
     "experience-skills-projects": {
         "max_experiences": 3,
         "max_projects": 2,
@@ -51,6 +59,51 @@ TEMPLATE_CONFIGS = {
     },
 }
 
+# Read-only views: configs are shared across requests and must not be mutated
+TEMPLATE_CONFIGS = MappingProxyType({
+    name: MappingProxyType(config) for name, config in _TEMPLATE_CONFIGS.items()
+})
+DEFAULT_TEMPLATE = "experience-skills-projects"
+_DEFAULT_TEMPLATE_CONFIG = TEMPLATE_CONFIGS[DEFAULT_TEMPLATE]
+
+TEMPLATE_DESCRIPTIONS = MappingProxyType({
+    "experience-skills-projects": (
+        "Best for experienced professionals. Emphasizes work history "
+        "and technical skills with selected projects."
+    ),
+    "education-research-skills": (
+        "Ideal for academics, researchers, and recent graduates. "
+        "Highlights education, publications, and research experience."
+    ),
+    "projects-skills-experience": (
+        "Great for developers and makers. Leads with project portfolio "
+        "and technical skills."
+    ),
+    "compact-technical": (
+        "Maximizes technical skill visibility. Compact layout for "
+        "roles requiring specific technical expertise."
+    ),
+})
+
+# model_dump_json emits fields in declaration order, so an entry cached by
+# alias always opens with these bytes
+_WIRE_FORMAT_PREFIXES = ('{"success":true,"pdfBase64":', '{"success":false,"pdfBase64":')
+
+
+def _resume_cache_key(
+    profile_id: str,
+    job_description: str,
+    output_format: ResumeOutputFormat,
+) -> str:
+    """Cache key for a compile result; JSON-only results never serve PDF requests."""
+    cache_key = generate_cache_key(profile_id, job_description, "resume")
+    return f"{cache_key}:json" if output_format == "json" else cache_key
+
+
+# Background refreshes of stale cache entries, keyed by cache key. Holding the
+# task here keeps it alive and lets concurrent stale hits share one refresh.
+_REFRESH_TASKS: Dict[str, asyncio.Task] = {}
+
 
 class ResumeCompiler:
     """
@@ -66,18 +119,97 @@ class ResumeCompiler:
             "max_resume_pages": self.settings.max_resume_pages,
         })
     
+    async def get_cached_response_json(
+        self,
+        profile: UserProfile,
+        job_description: str,
+        template: Optional[TemplateType] = None,
+        output_format: ResumeOutputFormat = "both",
+    ) -> Optional[str]:
+        """
+        Return the cached compile response as API-ready JSON, or None on a miss.
+
+        Entries are stored by alias, so the string can be sent to the client
+        as-is without validating and re-serializing a ResumeResponse.
+        Entries written before that (snake_case keys) are reported as a miss.
+        Stale entries are still returned and refreshed in the background.
+        """
+        cache_key = _resume_cache_key(profile.id, job_description, output_format)
+        cached_json, ttl = await get_cached_json_with_ttl(cache_key)
+        if cached_json is None or not cached_json.startswith(_WIRE_FORMAT_PREFIXES):
+            return None
+        log_cache_operation("get", cache_key, hit=True)
+        if self._is_stale(ttl):
+            self._schedule_refresh(cache_key, profile, job_description, template, output_format)
+        return cached_json
+
+    def _is_stale(self, ttl: int) -> bool:
+        """Entries in their last cache_stale_window seconds are past their fresh TTL."""
+        return 0 <= ttl <= self.settings.cache_stale_window
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        profile: UserProfile,
+        job_description: str,
+        template: Optional[TemplateType],
+        output_format: ResumeOutputFormat,
+    ) -> None:
+        """Recompute a stale cache entry in the background, once per key."""
+        if cache_key in _REFRESH_TASKS:
+            return
+        logger.info("Serving stale resume, refreshing in background", {
+            "request_id": get_request_id(),
+            "user_id": profile.id,
+        })
+        task = asyncio.create_task(self.compile(
+            profile,
+            job_description,
+            template,
+            output_format=output_format,
+            refresh=True,
+        ))
+        _REFRESH_TASKS[cache_key] = task
+        task.add_done_callback(lambda _: _REFRESH_TASKS.pop(cache_key, None))
+
+    @staticmethod
+    def _select_items(
+        profile: UserProfile,
+        job_description: str,
+        config: Mapping[str, Any],
+    ) -> tuple[dict[str, list], str]:
+        """
+        Score the profile against the job description and keep the top items
+        allowed by the template config. Returns the selection and job title.
+        """
+        scorer = RelevanceScorer(job_description)
+        selected = scorer.select_top_items(
+            profile,
+            max_experiences=config["max_experiences"],
+            max_projects=config["max_projects"],
+            max_skills=config["max_skills"],
+            max_education=config["max_education"],
+            max_publications=config["max_publications"],
+        )
+        return selected, scorer.job_title
+
     async def compile(
         self,
         profile: UserProfile,
         job_description: str,
         template: Optional[TemplateType] = None,
         use_cache: bool = True,
+        output_format: ResumeOutputFormat = "both",
+        refresh: bool = False,
     ) -> ResumeResponse:
         """
         Compile a tailored resume for the given profile and job description.
+        With output_format="json" the PDF stage is skipped entirely.
+        refresh=True skips the cache read but still stores the new result.
         """
         request_id = get_request_id()
         start_time = time.time()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         logger.start_operation("ResumeCompiler.compile", {
             "request_id": request_id,
@@ -85,10 +217,11 @@ class ResumeCompiler:
             "job_description_length": len(job_description),
             "template_requested": template,
             "use_cache": use_cache,
+            "output_format": output_format,
         })
         
         # Prepare cache key if needed
-        cache_key = generate_cache_key(profile.id, job_description, "resume")
+        cache_key = _resume_cache_key(profile.id, job_description, output_format)
         
         try:
             # Determine template to use
@@ -96,32 +229,37 @@ class ResumeCompiler:
                 template_val: TemplateType = (
                     profile.settings.selected_template
                     if profile.settings
-                    else "experience-skills-projects"
+                    else DEFAULT_TEMPLATE
                 )
             else:
                 template_val = template
             
-            logger.debug("Template selected", {
-                "request_id": request_id,
-                "template": template_val,
-                "from_profile_settings": template is None,
-            })
+            if debug_enabled:
+                logger.debug("Template selected", {
+                    "request_id": request_id,
+                    "template": template_val,
+                    "from_profile_settings": template is None,
+                })
             
             # Check cache
-            if use_cache:
-                logger.debug("Checking cache", {"request_id": request_id, "cache_key": cache_key[:50]})
+            if use_cache and not refresh:
+                if debug_enabled:
+                    logger.debug("Checking cache", {"request_id": request_id, "cache_key": cache_key[:50]})
                 
-                cached = await get_cached(cache_key)
+                cached, ttl = await get_cached_model_with_ttl(cache_key, ResumeResponse)
                 if cached:
                     log_cache_operation("get", cache_key, hit=True)
                     logger.info("Cache hit - returning cached resume", {
                         "request_id": request_id,
                         "user_id": profile.id,
                     })
-                    return ResumeResponse(**cached)
+                    if self._is_stale(ttl):
+                        self._schedule_refresh(cache_key, profile, job_description, template, output_format)
+                    return cached
                 
                 log_cache_operation("get", cache_key, hit=False)
-                logger.debug("Cache miss", {"request_id": request_id})
+                if debug_enabled:
+                    logger.debug("Cache miss", {"request_id": request_id})
             
             # Score and select items
             logger.info("Starting relevance scoring", {
@@ -131,16 +269,12 @@ class ResumeCompiler:
                 "skills_count": len(profile.skills) if profile.skills else 0,
             })
             
-            scorer = RelevanceScorer(job_description)
-            config = TEMPLATE_CONFIGS.get(str(template_val), TEMPLATE_CONFIGS["experience-skills-projects"])
+            config = TEMPLATE_CONFIGS.get(template_val, _DEFAULT_TEMPLATE_CONFIG)
             
-            selected = scorer.select_top_items(
-                profile,
-                max_experiences=config["max_experiences"],
-                max_projects=config["max_projects"],
-                max_skills=config["max_skills"],
-                max_education=config["max_education"],
-                max_publications=config["max_publications"],
+            # Scoring is pure CPU; keep it off the event loop so concurrent
+            # compiles and other requests are not stalled behind it
+            selected, job_title = await asyncio.to_thread(
+                self._select_items, profile, job_description, config
             )
             
             logger.info("Relevance scoring complete", {
@@ -149,7 +283,7 @@ class ResumeCompiler:
                 "selected_projects": len(selected["projects"]),
                 "selected_skills": len(selected["skills"]),
                 "selected_educations": len(selected["educations"]),
-                "job_title_extracted": scorer.job_title,
+                "job_title_extracted": job_title,
             })
             
             # Build compiled resume
@@ -162,14 +296,17 @@ class ResumeCompiler:
                 skills=selected["skills"],
                 publications=selected["publications"],
                 template=template_val,
-                job_title=scorer.job_title or None,
+                job_title=job_title or None,
             )
             
             # Generate PDF (if available)
             pdf_base64 = None
             pdf_error = None
             
-            if self.pdf_generator:
+            if output_format == "json":
+                if debug_enabled:
+                    logger.debug("Skipping PDF generation - JSON requested", {"request_id": request_id})
+            elif self.pdf_generator:
                 logger.info("Generating PDF", {"request_id": request_id})
                 pdf_start = time.time()
                 
@@ -218,12 +355,17 @@ class ResumeCompiler:
                 error=response_error,
             )
             
-            # Cache successful result
+            # Cache successful result; it is fresh for cache_ttl, then served
+            # stale (and refreshed) for cache_stale_window
             if use_cache:
-                logger.debug("Caching result", {"request_id": request_id})
+                if debug_enabled:
+                    logger.debug("Caching result", {"request_id": request_id})
                 await set_cached(
                     cache_key,
-                    response.model_dump(mode="json"),
+                    response,
+                    ttl=self.settings.cache_ttl + self.settings.cache_stale_window,
+                    compress=True,
+                    by_alias=True,
                 )
                 log_cache_operation("set", cache_key, hit=True)
             
@@ -272,22 +414,4 @@ class ResumeCompiler:
     
     def _get_template_description(self, template: str) -> str:
         """Get human-readable description for a template."""
-        descriptions = {
-            "experience-skills-projects": (
-                "Best for experienced professionals. Emphasizes work history "
-                "and technical skills with selected projects."
-            ),
-            "education-research-skills": (
-                "Ideal for academics, researchers, and recent graduates. "
-                "Highlights education, publications, and research experience."
-            ),
-            "projects-skills-experience": (
-                "Great for developers and makers. Leads with project portfolio "
-                "and technical skills."
-            ),
-            "compact-technical": (
-                "Maximizes technical skill visibility. Compact layout for "
-                "roles requiring specific technical expertise."
-            ),
-        }
-        return descriptions.get(template, "Custom template")
+        return TEMPLATE_DESCRIPTIONS.get(template, "Custom template")
@@ -11,28 +11,56 @@ Enhanced with:
 - Shared AsyncGroq client for efficiency
 """
 
+import base64
+import codecs
+import hashlib
 import io
 import os
 import re
 import json
+import logging
 import time
 import traceback
 import asyncio
-from typing import Dict, List, Optional, Any
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from app.utils.logger import logger, log_function_call
+from app.utils.redis_cache import CACHE_NAMESPACE, get_cached, set_cached
 from app.config import get_settings
 
+# LLM JSON output is parsed on the event loop; orjson keeps that cheap
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Same transport preference as GroqClient: aiohttp (groq[aiohttp]) when
+# installed, otherwise the SDK's default httpx client
+try:
+    import httpx_aiohttp  # noqa: F401
+    _use_aiohttp = True
+except ImportError:
+    _use_aiohttp = False
+
 try:
     import fitz  # PyMuPDF
     PYMUPDF_AVAILABLE = True
+    # Plain text only: keep whitespace and clip to the page, let MuPDF join
+    # hyphenated line breaks, and expand ligatures so "ﬁ" matches "fi"
+    _PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
 except ImportError:
     PYMUPDF_AVAILABLE = False
+    _PDF_TEXT_FLAGS = 0
     logger.warning("[ResumeParser] PyMuPDF not installed, PDF parsing will be limited")
 
 try:
     from docx import Document
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
@@ -48,6 +76,11 @@ MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
 # Cap concurrent chunk extractions to avoid Groq rate limits while cutting wall time.
 MAX_PARALLEL_CHUNK_EXTRACTS = 3
+# Truncated prompt text may end this many chars early to stop at a line break
+PROMPT_LINE_SLACK = 500
+
+# Parsed results are cached by content hash so re-uploads skip the LLM
+PARSE_CACHE_PREFIX = f"{CACHE_NAMESPACE}:parse"
 
 # Embedded document images (profile photos, logos in PDF/DOCX)
 MAX_EXTRACTED_IMAGES = 5
@@ -55,6 +88,61 @@ MAX_IMAGE_BYTES = 400_000  # ~400KB raw bytes before base64
 MIN_IMAGE_DIM = 48  # skip tiny icons
 MAX_IMAGE_DIM = 2048
 
+# Patterns used by the regex fallback extractor, compiled once
+_NAME_LINE_RE = re.compile(r'^[A-Z][a-z]+(\s+[A-Z][a-z]+){1,3}$')
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RES = (
+    re.compile(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),
+    re.compile(r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}'),
+)
+_SKILLS_SECTION_RES = (
+    re.compile(
+        r'(?:skills?|technical skills?|technologies?|proficiencies?)[:\s]*([^\n]+(?:\n(?![A-Z][a-z]+:)[^\n]+)*)',
+        re.IGNORECASE,
+    ),
+    re.compile(r'(?:programming|languages?)[:\s]*([^\n]+)', re.IGNORECASE),
+)
+_SKILL_SPLIT_RE = re.compile(r'[,|•·;\n]')
+
+# Contact patterns for _extract_contact_fields
+_CONTACT_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+_CONTACT_PHONE_RES = (
+    re.compile(r"\(\+\d{1,3}\)\s*[\d\s\-.]{8,20}"),
+    re.compile(r"\+\d{1,3}[\s\-][\d\s\-.]{8,18}"),
+    re.compile(r"(?:\(?\d{2,4}\)?[\s\-.]?)?\d{3,4}[\s\-.]?\d{3,4}[\s\-.]?\d{3,4}"),
+)
+_DIGIT_RE = re.compile(r"\d")
+# RFC 5321 length limits bound how far an email extends around its '@'
+_EMAIL_LOCAL_MAX = 64
+_EMAIL_DOMAIN_MAX = 255
+# Phone patterns match at most 3 chars ("+", separator, "(") before a digit
+_PHONE_PREFIX_MAX = 3
+
+# Markdown code fences LLMs sometimes wrap JSON responses in
+_MD_FENCE_OPEN_RE = re.compile(r'```\w*\n?')
+
+# Extracted-text cleanup
+_PDF_ICON_GLYPH_RE = re.compile(r"[\ue000-\uf8ff\uf000-\uf0ff]")
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\s*\n\s*(\w)")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# WordprocessingML tags (Clark notation) for walking DOCX XML directly
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P = _W_NS + "p"
+_W_TBL = _W_NS + "tbl"
+_W_TR = _W_NS + "tr"
+_W_TC = _W_NS + "tc"
+_W_T = _W_NS + "t"
+_W_TAB = _W_NS + "tab"
+_W_BR = _W_NS + "br"
+_W_CR = _W_NS + "cr"
+
+# PDFs with at least this many pages have their text extracted across worker
+# processes; below it, spawning/pickling costs more than the parallelism saves
+PDF_PARALLEL_MIN_PAGES = 3
+
 
 # Module-level shared AsyncGroq client (lazy initialization)
 _groq_client = None
@@ -68,11 +156,228 @@ def get_groq_client() -> Optional[Any]:
         if not settings.groq_api_key:
             return None
         from groq import AsyncGroq
-        _groq_client = AsyncGroq(api_key=settings.groq_api_key)
-        logger.info("[ResumeParser] Shared AsyncGroq client created")
+        if _use_aiohttp:
+            from groq import DefaultAioHttpClient
+            _groq_client = AsyncGroq(
+                api_key=settings.groq_api_key,
+                http_client=DefaultAioHttpClient(),
+            )
+        else:
+            _groq_client = AsyncGroq(api_key=settings.groq_api_key)
+        logger.info("[ResumeParser] Shared AsyncGroq client created", {
+            "http_backend": "aiohttp" if _use_aiohttp else "httpx",
+        })
     return _groq_client
 
 
+async def close_groq_client() -> None:
+    """Close the shared AsyncGroq client (called on app shutdown)."""
+    global _groq_client
+    if _groq_client is not None:
+        await _groq_client.close()
+        _groq_client = None
+        logger.info("[ResumeParser] Shared AsyncGroq client closed")
+
+
+# PyMuPDF is not thread-safe; fitz calls made in this process are serialized.
+# Hold it only around those calls, never while waiting on the process pool.
+_PYMUPDF_LOCK = threading.Lock()
+
+# Process pool for PyMuPDF text extraction (CPU-bound, holds the GIL)
+_pdf_text_pool: Optional[ProcessPoolExecutor] = None
+# Guards pool creation and shutdown across upload worker threads
+_pdf_text_pool_lock = threading.RLock()
+_pdf_text_pool_workers = 0
+# Set once the pool proves unusable on this host (e.g. no POSIX semaphores on
+# serverless runtimes) so later uploads go straight to sequential extraction
+_pdf_text_pool_disabled = False
+
+
+def _pdf_pool_mp_context():
+    """
+    Start method for pool workers. The pool is created from a worker thread of
+    a multithreaded server, where fork() can copy held locks into the child.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def get_pdf_text_pool() -> Optional[ProcessPoolExecutor]:
+    """Get or create the PDF text process pool; None when parallelism is off."""
+    global _pdf_text_pool, _pdf_text_pool_workers
+    pool = _pdf_text_pool
+    if pool is not None:
+        return pool
+    with _pdf_text_pool_lock:
+        if _pdf_text_pool is None:
+            if _pdf_text_pool_disabled:
+                return None
+            workers = min(os.cpu_count() or 1, get_settings().pdf_parse_workers)
+            if workers < 2:
+                return None
+            try:
+                _pdf_text_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=_pdf_pool_mp_context(),
+                )
+            except (OSError, NotImplementedError, ValueError) as e:
+                _disable_pdf_text_pool(e)
+                return None
+            _pdf_text_pool_workers = workers
+            logger.info("[ResumeParser] PDF text process pool initialized", {"workers": workers})
+        return _pdf_text_pool
+
+
+def _disable_pdf_text_pool(error: BaseException) -> None:
+    """Stop using the process pool for the rest of this process's life."""
+    global _pdf_text_pool_disabled
+    with _pdf_text_pool_lock:
+        _pdf_text_pool_disabled = True
+        close_pdf_text_pool(reset_disabled=False)
+    logger.warning("[ResumeParser] PDF text process pool unavailable, using sequential extraction", {
+        "error_type": type(error).__name__,
+        "error": str(error),
+    })
+
+
+def close_pdf_text_pool(reset_disabled: bool = True) -> None:
+    """Shut down the PDF text process pool (called on app shutdown)."""
+    global _pdf_text_pool, _pdf_text_pool_disabled
+    with _pdf_text_pool_lock:
+        if _pdf_text_pool is not None:
+            _pdf_text_pool.shutdown(wait=False, cancel_futures=True)
+            _pdf_text_pool = None
+        if reset_disabled:
+            _pdf_text_pool_disabled = False
+
+
+def _extract_page_text(page) -> str:
+    """Extract one page's text, falling back to richer modes for sparse pages."""
+    # Build the page's text layer once; every mode below reads from it
+    # instead of re-running MuPDF's layout analysis
+    textpage = page.get_textpage(flags=_PDF_TEXT_FLAGS)
+    
+    # Method 1: Standard text extraction
+    page_text = page.get_text("text", textpage=textpage, sort=False)
+    
+    # Method 2: If standard yields little text, try blocks
+    if len(page_text.strip()) < 100:
+        blocks = page.get_text("blocks", textpage=textpage)
+        block_text = "\n".join([b[4] for b in blocks if isinstance(b[4], str)])
+        if len(block_text) > len(page_text):
+            page_text = block_text
+    
+    # Method 3: Try dict extraction for complex layouts
+    if len(page_text.strip()) < 100:
+        dict_data = page.get_text("dict", textpage=textpage)
+        dict_text = ""
+        for block in dict_data.get("blocks", []):
+            if "lines" in block:
+                for line in block["lines"]:
+                    for span in line.get("spans", []):
+                        dict_text += span.get("text", "") + " "
+                    dict_text += "\n"
+        if len(dict_text) > len(page_text):
+            page_text = dict_text
+    
+    # Space/tab runs never span the page separator, so collapsing them here
+    # matches a whole-document pass and, for large PDFs, runs in the pool
+    return _INLINE_SPACE_RE.sub(" ", page_text)
+
+
+def _parse_cache_key(file_content: bytes, filename_lower: str, file_type: str) -> str:
+    """
+    Content-addressed cache key for a parse result.
+
+    The extension and file_type change how the bytes are parsed, so they are
+    hashed in too. Keys have no user segment and stay out of per-user indexes.
+    """
+    hasher = hashlib.blake2b(file_content, digest_size=16)
+    hasher.update(b"\0" + os.path.splitext(filename_lower)[1].encode())
+    hasher.update(b"\0" + file_type.encode())
+    return f"{PARSE_CACHE_PREFIX}:{hasher.hexdigest()}"
+
+
+def _search_email(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    """
+    Search for an email only in windows around '@' characters.
+
+    str.find skips ahead in C, so text without an '@' never reaches the regex
+    and long resumes are only matched near candidate addresses.
+    """
+    at = text.find("@")
+    while at != -1:
+        match = pattern.search(text, max(0, at - _EMAIL_LOCAL_MAX), at + _EMAIL_DOMAIN_MAX + 1)
+        if match:
+            return match
+        at = text.find("@", at + 1)
+    return None
+
+
+def _phone_search_start(text: str) -> int:
+    """Earliest position a phone match can start, or -1 if text has no digit."""
+    digit = _DIGIT_RE.search(text)
+    if digit is None:
+        return -1
+    return max(0, digit.start() - _PHONE_PREFIX_MAX)
+
+
+def _strip_md_fence(content: str) -> str:
+    """
+    Remove a markdown code fence wrapped around stripped LLM output.
+
+    The opening fence is matched at offset 0 only and the closing one is a
+    suffix check, so unfenced JSON is returned without scanning it.
+    """
+    opening = _MD_FENCE_OPEN_RE.match(content)
+    if opening is None:
+        return content
+    content = content[opening.end():]
+    if content.endswith("```"):
+        content = content[:-3]
+        if content.endswith("\n"):
+            content = content[:-1]
+    return content
+
+
+def _truncate_for_prompt(text: str, max_chars: int = MAX_CHUNK_CHARS) -> str:
+    """
+    Trim text to max_chars so no half-word or half-line ends the prompt.
+
+    A line break near the limit is preferred, since it ends a complete
+    sentence or bullet; otherwise the cut falls at the last word boundary.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", max(0, max_chars - PROMPT_LINE_SLACK), max_chars + 1)
+    if cut <= 0:
+        cut = text.rfind(" ", 0, max_chars + 1)
+    return text[:cut if cut > 0 else max_chars].rstrip()
+
+
+def _docx_paragraph_text(p_elem) -> str:
+    """Text of a w:p element, matching python-docx Paragraph.text."""
+    parts = []
+    for node in p_elem.iter(_W_T, _W_TAB, _W_BR, _W_CR):
+        if node.tag == _W_T:
+            if node.text:
+                parts.append(node.text)
+        elif node.tag == _W_TAB:
+            parts.append("\t")
+        else:
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _extract_pdf_page_range(file_content: bytes, start: int, stop: int) -> List[str]:
+    """Process-pool worker: extract text for pages [start, stop) of a PDF."""
+    doc = fitz.open(stream=file_content, filetype="pdf")
+    try:
+        return [_extract_page_text(doc[i]) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
 @dataclass
 class ExtractedExperience:
     """Structured experience data extracted from resume"""
@@ -206,14 +511,26 @@ class ResumeParser:
             filename_lower = filename.lower()
             images: List[Dict[str, Any]] = []
 
+            # Identical re-uploads reuse the earlier LLM extraction
+            cache_key = _parse_cache_key(file_content, filename_lower, file_type)
+            cached = await get_cached(cache_key)
+            if cached:
+                duration_ms = (time.time() - start_time) * 1000
+                logger.end_operation("resume_parse", duration_ms, {
+                    "filename": filename,
+                    "file_type": file_type,
+                    "cached": True,
+                })
+                return cached
+
+            # Extraction is synchronous and CPU-bound: run it in a worker thread
+            # so the event loop keeps serving other requests meanwhile
             if filename_lower.endswith('.pdf'):
-                text = self._extract_text_from_pdf(file_content)
-                images = self._extract_images_from_pdf(file_content)
+                text, images = await asyncio.to_thread(self._extract_pdf_document, file_content)
             elif filename_lower.endswith(('.docx', '.doc')):
-                text = self._extract_text_from_docx(file_content)
-                images = self._extract_images_from_docx(file_content)
+                text, images = await asyncio.to_thread(self._extract_docx_document, file_content)
             elif filename_lower.endswith(('.txt', '.md', '.markdown')):
-                text = self._extract_text_from_plaintext(file_content)
+                text = await asyncio.to_thread(self._extract_text_from_plaintext, file_content)
             else:
                 logger.warning("[ResumeParser] Unsupported file type", {"filename": filename})
                 return {"error": "Unsupported file type. Please upload PDF, DOCX, TXT, or MD."}
@@ -225,7 +542,7 @@ class ResumeParser:
             })
             
             # Debug-only preview (not in production INFO logs)
-            if text:
+            if text and logger.isEnabledFor(logging.DEBUG):
                 logger.debug("[ResumeParser] Text preview", {"preview": text[:300]})
             
             if not text or len(text.strip()) < 50:
@@ -263,6 +580,7 @@ class ResumeParser:
                     "word_count": result.get("word_count"),
                     "images_found": len(images),
                 })
+                await self._cache_parse_result(cache_key, result)
                 return result
             
             # Structure the extracted text using LLM
@@ -290,6 +608,7 @@ class ResumeParser:
                 "has_phone": bool(structured_data.get("phone")),
             })
             
+            await self._cache_parse_result(cache_key, structured_data)
             return structured_data
             
         except Exception as e:
@@ -307,15 +626,22 @@ class ResumeParser:
                 "traceback": error_traceback if self.settings.environment == "development" else None,
             }
     
+    async def _cache_parse_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache LLM-structured results; regex/basic fallbacks are retried next time."""
+        if result.get("extraction_method") != "llm":
+            return
+        # Results embed base64 images, so store them compressed
+        await set_cached(cache_key, result, ttl=self.settings.cache_ttl_long, compress=True)
+
     def _clean_pdf_text(self, text: str) -> str:
         """Strip PDF font-icon private-use glyphs and normalize whitespace."""
         if not text:
             return ""
         # Private Use Area / common PDF icon font garbage (FontAwesome, etc.)
-        cleaned = re.sub(r"[\ue000-\uf8ff\uf000-\uf0ff]", " ", text)
+        cleaned = _PDF_ICON_GLYPH_RE.sub(" ", text)
         cleaned = cleaned.replace("\u00a0", " ")
-        cleaned = re.sub(r"[ \t]+", " ", cleaned)
-        cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+        cleaned = _INLINE_SPACE_RE.sub(" ", cleaned)
+        cleaned = _EXTRA_BLANK_LINES_RE.sub("\n\n", cleaned)
         # Decode common HTML entities that leak from PDF extractors
         cleaned = (
             cleaned.replace("&amp;", "&")
@@ -330,17 +656,11 @@ class ResumeParser:
         Deterministic contact extraction (no LLM). Prefer these over LLM guesses
         so email/phone/website are always filled when present in the document.
         """
-        email_match = re.search(
-            r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}",
-            text,
-        )
+        email_match = _search_email(_CONTACT_EMAIL_RE, text)
         phone = None
-        for phone_pat in (
-            r"\(\+\d{1,3}\)\s*[\d\s\-.]{8,20}",
-            r"\+\d{1,3}[\s\-][\d\s\-.]{8,18}",
-            r"(?:\(?\d{2,4}\)?[\s\-.]?)?\d{3,4}[\s\-.]?\d{3,4}[\s\-.]?\d{3,4}",
-        ):
-            phone_match = re.search(phone_pat, text)
+        phone_start = _phone_search_start(text)
+        for phone_pat in _CONTACT_PHONE_RES if phone_start != -1 else ():
+            phone_match = phone_pat.search(text, phone_start)
             if phone_match:
                 candidate = phone_match.group(0).strip()
                 digits = re.sub(r"\D", "", candidate)
@@ -427,7 +747,7 @@ class ResumeParser:
             body,
         )
         body = re.sub(r"(?im)^\s*.{0,40}·\s*cover letter\s*$", "", body)
-        body = re.sub(r"\n{3,}", "\n\n", body).strip()
+        body = _EXTRA_BLANK_LINES_RE.sub("\n\n", body).strip()
         return body
 
     async def _parse_cover_letter(self, text: str) -> Dict[str, Any]:
@@ -509,7 +829,7 @@ CRITICAL RULES:
 }}
 
 Cover Letter Text:
-{cleaned[:MAX_CHUNK_CHARS]}
+{_truncate_for_prompt(cleaned)}
 
 Return ONLY JSON, no markdown or explanation."""
 
@@ -533,11 +853,9 @@ Return ONLY JSON, no markdown or explanation."""
                 raise ValueError("Empty response from LLM")
             content = response.choices[0].message.content.strip()
 
-            if content.startswith("```"):
-                content = re.sub(r"^```\w*\n?", "", content)
-                content = re.sub(r"\n?```$", "", content)
+            content = _strip_md_fence(content)
 
-            result = json.loads(content)
+            result = _json_loads(content)
             result["extraction_method"] = "llm"
 
             if result.get("sender_name") and not result.get("name"):
@@ -613,19 +931,18 @@ Return ONLY JSON, no markdown or explanation."""
         page: Optional[int] = None,
     ) -> Optional[Dict[str, Any]]:
         """Build a base64 data-URL image record with size/dimension guards."""
-        import base64
-
         if width < MIN_IMAGE_DIM or height < MIN_IMAGE_DIM:
             return None
         if width > MAX_IMAGE_DIM and height > MAX_IMAGE_DIM:
             # Likely a full-page scan — still keep if not huge on disk
             pass
         if len(raw) > MAX_IMAGE_BYTES:
-            logger.debug("[ResumeParser] Skipping large image", {
-                "bytes": len(raw),
-                "width": width,
-                "height": height,
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ResumeParser] Skipping large image", {
+                    "bytes": len(raw),
+                    "width": width,
+                    "height": height,
+                })
             return None
 
         ext_norm = (ext or "jpeg").lower().replace("jpg", "jpeg")
@@ -646,15 +963,22 @@ Return ONLY JSON, no markdown or explanation."""
             "data_url": f"data:{mime};base64,{b64}",
         }
 
-    def _extract_images_from_pdf(self, file_content: bytes) -> List[Dict[str, Any]]:
-        """Extract embedded images from a PDF via PyMuPDF."""
+    def _extract_images_from_pdf(self, file_content: bytes, doc: Optional[Any] = None) -> List[Dict[str, Any]]:
+        """
+        Extract embedded images from a PDF via PyMuPDF.
+
+        An already-open ``fitz.Document`` may be passed to skip re-parsing the
+        bytes; it is left open for the caller to close.
+        """
         if not PYMUPDF_AVAILABLE:
             return []
 
         images: List[Dict[str, Any]] = []
         seen_xrefs: set = set()
+        own_doc = doc is None
         try:
-            doc = fitz.open(stream=file_content, filetype="pdf")
+            if own_doc:
+                doc = fitz.open(stream=file_content, filetype="pdf")
             for page_index, page in enumerate(doc):
                 for img in page.get_images(full=True):
                     xref = img[0]
@@ -688,7 +1012,6 @@ Return ONLY JSON, no markdown or explanation."""
                         break
                 if len(images) >= MAX_EXTRACTED_IMAGES:
                     break
-            doc.close()
             logger.info("[ResumeParser] PDF image extraction complete", {
                 "images": len(images),
             })
@@ -697,6 +1020,9 @@ Return ONLY JSON, no markdown or explanation."""
                 "error_type": type(e).__name__,
                 "error": str(e),
             })
+        finally:
+            if own_doc and doc is not None:
+                doc.close()
         return images
 
     def _extract_images_from_docx(self, file_content: bytes) -> List[Dict[str, Any]]:
@@ -706,8 +1032,6 @@ Return ONLY JSON, no markdown or explanation."""
 
         images: List[Dict[str, Any]] = []
         try:
-            from docx.opc.constants import RELATIONSHIP_TYPE as RT
-
             doc = Document(io.BytesIO(file_content))
             for rel in doc.part.rels.values():
                 if rel.reltype != RT.IMAGE:
@@ -758,58 +1082,103 @@ Return ONLY JSON, no markdown or explanation."""
             })
         return images
     
-    def _extract_text_from_pdf(self, file_content: bytes) -> str:
-        """Extract text from a PDF file using PyMuPDF."""
+    def _extract_pdf_document(self, file_content: bytes) -> Tuple[str, List[Dict[str, Any]]]:
+        """Extract text and embedded images from a PDF (runs in a worker thread)."""
+        # Parse the PDF once and share it between both passes. Text extraction
+        # takes _PYMUPDF_LOCK itself so it can release it while pool workers run.
+        doc = None
+        if PYMUPDF_AVAILABLE:
+            with _PYMUPDF_LOCK:
+                doc = fitz.open(stream=file_content, filetype="pdf")
+        try:
+            text = self._extract_text_from_pdf(file_content, doc)
+            with _PYMUPDF_LOCK:
+                images = self._extract_images_from_pdf(file_content, doc)
+            return text, images
+        finally:
+            if doc is not None:
+                with _PYMUPDF_LOCK:
+                    doc.close()
+
+    def _extract_docx_document(self, file_content: bytes) -> Tuple[str, List[Dict[str, Any]]]:
+        """Extract text and embedded images from a DOCX (runs in a worker thread)."""
+        text = self._extract_text_from_docx(file_content)
+        # Image probing decodes through PyMuPDF Pixmaps
+        with _PYMUPDF_LOCK:
+            images = self._extract_images_from_docx(file_content)
+        return text, images
+
+    def _extract_text_from_pdf(self, file_content: bytes, doc: Optional[Any] = None) -> str:
+        """
+        Extract text from a PDF file using PyMuPDF.
+
+        An already-open ``fitz.Document`` may be passed to skip re-parsing the
+        bytes; it is left open for the caller to close. Callers must not hold
+        _PYMUPDF_LOCK; it is taken here around in-process fitz calls only.
+        """
         logger.debug("[ResumeParser] Extracting text from PDF")
         
         if not PYMUPDF_AVAILABLE:
             logger.error("[ResumeParser] PyMuPDF not available")
             raise ImportError("PyMuPDF is required for PDF parsing. Install with: pip install PyMuPDF")
         
+        own_doc = doc is None
         try:
-            doc = fitz.open(stream=file_content, filetype="pdf")
-            text_parts = []
+            with _PYMUPDF_LOCK:
+                if own_doc:
+                    doc = fitz.open(stream=file_content, filetype="pdf")
+                page_count = doc.page_count
+            text_parts = None
             
-            for page_num, page in enumerate(doc):
-                # Try multiple extraction methods for better results
-                # Method 1: Standard text extraction
-                page_text = page.get_text("text")
-                
-                # Method 2: If standard yields little text, try blocks
-                if len(page_text.strip()) < 100:
-                    blocks = page.get_text("blocks")
-                    block_text = "\n".join([b[4] for b in blocks if isinstance(b[4], str)])
-                    if len(block_text) > len(page_text):
-                        page_text = block_text
-                
-                # Method 3: Try dict extraction for complex layouts
-                if len(page_text.strip()) < 100:
-                    dict_data = page.get_text("dict")
-                    dict_text = ""
-                    for block in dict_data.get("blocks", []):
-                        if "lines" in block:
-                            for line in block["lines"]:
-                                for span in line.get("spans", []):
-                                    dict_text += span.get("text", "") + " "
-                                dict_text += "\n"
-                    if len(dict_text) > len(page_text):
-                        page_text = dict_text
-                
-                text_parts.append(page_text)
-                logger.debug(f"[ResumeParser] Page {page_num + 1} extracted", {
-                    "chars": len(page_text),
+            if page_count >= PDF_PARALLEL_MIN_PAGES:
+                try:
+                    pool = get_pdf_text_pool()
+                    if pool is not None:
+                        # One contiguous page range per worker; each reopens the
+                        # PDF from bytes, so only the bytes and page texts are pickled.
+                        # _PYMUPDF_LOCK is not held here, so other uploads proceed.
+                        workers = min(_pdf_text_pool_workers, page_count)
+                        bounds = [page_count * i // workers for i in range(workers + 1)]
+                        ranges = pool.map(
+                            _extract_pdf_page_range,
+                            [file_content] * workers,
+                            bounds[:-1],
+                            bounds[1:],
+                        )
+                        text_parts = [text for part in ranges for text in part]
+                except (BrokenExecutor, OSError) as pool_err:
+                    # The pool itself is unusable here; don't retry per upload
+                    _disable_pdf_text_pool(pool_err)
+                except Exception as pool_err:
+                    logger.warning("[ResumeParser] Parallel PDF extraction failed, falling back", {
+                        "error_type": type(pool_err).__name__,
+                        "error": str(pool_err),
+                    })
+            
+            if text_parts is None:
+                with _PYMUPDF_LOCK:
+                    text_parts = [_extract_page_text(page) for page in doc]
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ResumeParser] PDF pages extracted", {
+                    "page_chars": [len(page_text) for page_text in text_parts],
                 })
             
-            doc.close()
+            if own_doc:
+                with _PYMUPDF_LOCK:
+                    doc.close()
             full_text = "\n\n".join(text_parts)
+            # Release the per-page strings before the cleanup passes below
+            # each build another full-size copy
+            del text_parts
             
-            # Clean up PDF artifacts while preserving structure
-            full_text = re.sub(r'[ \t]+', ' ', full_text)  # Normalize spaces
-            full_text = re.sub(r'\n{3,}', '\n\n', full_text)  # Max 2 newlines
-            full_text = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', full_text)  # Fix hyphenation
+            # Clean up PDF artifacts while preserving structure (spaces were
+            # normalized per page; these two can span page boundaries)
+            full_text = _EXTRA_BLANK_LINES_RE.sub('\n\n', full_text)  # Max 2 newlines
+            full_text = _HYPHEN_BREAK_RE.sub(r'\1\2', full_text)  # Fix hyphenation
             
             logger.info("[ResumeParser] PDF text extraction complete", {
-                "total_pages": len(text_parts),
+                "total_pages": page_count,
                 "total_chars": len(full_text),
             })
             
@@ -823,6 +1192,11 @@ Return ONLY JSON, no markdown or explanation."""
                 "traceback": error_traceback,
             })
             raise
+        finally:
+            # The success path closes early, before cleanup; this covers errors
+            if own_doc and doc is not None and not doc.is_closed:
+                with _PYMUPDF_LOCK:
+                    doc.close()
     
     def _extract_text_from_docx(self, file_content: bytes) -> str:
         """Extract text from a DOCX file."""
@@ -835,26 +1209,36 @@ Return ONLY JSON, no markdown or explanation."""
         try:
             doc = Document(io.BytesIO(file_content))
             text_parts = []
+            paragraph_count = 0
+            table_count = 0
             
-            for para in doc.paragraphs:
-                if para.text.strip():
-                    text_parts.append(para.text)
-            
-            # Also get text from tables
-            for table in doc.tables:
-                for row in table.rows:
+            # One pass over the body XML in document order, so tables stay
+            # where they appear; no Paragraph/_Cell wrapper objects are built
+            for elem in doc.element.body.iterchildren(_W_P, _W_TBL):
+                if elem.tag == _W_P:
+                    paragraph_count += 1
+                    para_text = _docx_paragraph_text(elem)
+                    if para_text.strip():
+                        text_parts.append(para_text)
+                    continue
+                
+                table_count += 1
+                for row in elem.iterchildren(_W_TR):
                     row_text = []
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            row_text.append(cell.text.strip())
+                    for cell in row.iterchildren(_W_TC):
+                        cell_text = "\n".join(
+                            _docx_paragraph_text(p) for p in cell.iterchildren(_W_P)
+                        ).strip()
+                        if cell_text:
+                            row_text.append(cell_text)
                     if row_text:
                         text_parts.append(" | ".join(row_text))
             
             full_text = "\n".join(text_parts)
             
             logger.info("[ResumeParser] DOCX text extraction complete", {
-                "paragraphs": len(doc.paragraphs),
-                "tables": len(doc.tables),
+                "paragraphs": paragraph_count,
+                "tables": table_count,
                 "total_chars": len(full_text),
             })
             
@@ -874,7 +1258,15 @@ Return ONLY JSON, no markdown or explanation."""
         logger.debug("[ResumeParser] Extracting text from plaintext/markdown")
         
         try:
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'ascii']
+            # A BOM settles the encoding up front. Otherwise try UTF-8, then
+            # the Windows code page most non-UTF-8 resumes are saved in.
+            if file_content.startswith(codecs.BOM_UTF8):
+                encodings = ['utf-8-sig']
+            elif file_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                encodings = ['utf-16']
+            else:
+                encodings = []
+            encodings += ['utf-8', 'cp1252']
             
             for encoding in encodings:
                 try:
@@ -887,8 +1279,9 @@ Return ONLY JSON, no markdown or explanation."""
                 except UnicodeDecodeError:
                     continue
             
-            text = file_content.decode('utf-8', errors='replace')
-            logger.warning("[ResumeParser] Plaintext decoded with replacement characters")
+            # latin-1 maps every byte, so this cannot fail
+            text = file_content.decode('latin-1')
+            logger.warning("[ResumeParser] Plaintext decoded with latin-1 fallback")
             return text
             
         except Exception as e:
@@ -996,7 +1389,7 @@ Return ONLY JSON, no markdown or explanation."""
         """Split text by size at sentence boundaries."""
         chunks = []
         current = ""
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         
         for sentence in sentences:
             if len(current) + len(sentence) > MAX_CHUNK_CHARS:
@@ -1068,7 +1461,9 @@ Return ONLY JSON, no markdown or explanation."""
             return merged
             
         except Exception as e:
-            error_traceback = traceback.format_exc()
+            # Expected failure mode (Groq outage, bad JSON after retries); the
+            # message and type identify it, so only format frames for debug
+            error_traceback = traceback.format_exc() if logger.isEnabledFor(logging.DEBUG) else None
             logger.warning("[ResumeParser] LLM extraction failed, falling back to regex", {
                 "error": str(e),
                 "error_type": type(e).__name__,
@@ -1198,7 +1593,8 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
         content = ""  # Initialize before try block
         for attempt in range(MAX_RETRIES):
             try:
-                response = await client.chat.completions.create(
+                content = ""
+                stream = await client.chat.completions.create(
                     model=LLM_MODEL,
                     messages=[
                         {"role": "system", "content": "You are a precise resume parser. Extract all structured data exhaustively. Return valid JSON only. Never skip projects or experiences."},
@@ -1206,22 +1602,35 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
                     ],
                     temperature=0.1,
                     max_tokens=MAX_OUTPUT_TOKENS,
+                    stream=True,
                 )
                 
-                content = response.choices[0].message.content.strip()
+                # Accumulate deltas as they arrive instead of waiting on the
+                # whole completion body
+                parts: List[str] = []
+                first_token_ms = None
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if first_token_ms is None:
+                            first_token_ms = (time.time() - start_time) * 1000
+                        parts.append(delta)
+                
+                content = "".join(parts).strip()
                 
                 # Clean up markdown formatting
-                if content.startswith("```"):
-                    content = re.sub(r'^```\w*\n?', '', content)
-                    content = re.sub(r'\n?```$', '', content)
+                content = _strip_md_fence(content)
                 
-                result = json.loads(content)
+                result = _json_loads(content)
                 
                 duration_ms = (time.time() - start_time) * 1000
                 logger.end_operation("llm_chunk_extract", duration_ms, {
                     "model": LLM_MODEL,
                     "attempt": attempt + 1,
-                    "tokens_used": response.usage.total_tokens if response.usage else None,
+                    "first_token_ms": round(first_token_ms, 2) if first_token_ms is not None else None,
+                    "response_length": len(content),
                     "experiences_found": len(result.get("experiences", [])),
                     "projects_found": len(result.get("projects", [])),
                 })
@@ -1270,6 +1679,10 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
             "publications": [],
             "certifications": [],
         }
+        # Membership sets keep skill/cert dedup O(1) per item; non-string
+        # values from the LLM are keyed by repr so they stay hashable
+        seen_skills: set = set()
+        seen_certs: set = set()
         
         for result in results:
             # Take first non-null values for single fields
@@ -1290,12 +1703,16 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
             
             # Merge skills (deduplicate)
             for skill in result.get("skills", []):
-                if skill and skill not in merged["skills"]:
+                key = skill if isinstance(skill, str) else repr(skill)
+                if skill and key not in seen_skills:
+                    seen_skills.add(key)
                     merged["skills"].append(skill)
             
             # Merge certifications (deduplicate)
             for cert in result.get("certifications", []):
-                if cert and cert not in merged["certifications"]:
+                key = cert if isinstance(cert, str) else repr(cert)
+                if cert and key not in seen_certs:
+                    seen_certs.add(key)
                     merged["certifications"].append(cert)
         
         # Remove duplicates from lists based on key fields
@@ -1314,15 +1731,17 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
         return merged
     
     def _deduplicate_list(self, items: List[Dict], *key_fields: str) -> List[Dict]:
-        """Remove duplicate items based on key fields."""
-        seen = set()
-        unique = []
-        for item in items:
-            key = tuple(str(item.get(f, "")).lower() for f in key_fields)
-            if key not in seen:
-                seen.add(key)
-                unique.append(item)
-        return unique
+        """Remove duplicate items based on key fields (first occurrence wins)."""
+        unique: Dict[Any, Dict] = {}
+        if len(key_fields) == 1:
+            # Single-field keys (projects, publications) skip the tuple
+            field = key_fields[0]
+            for item in items:
+                unique.setdefault(str(item.get(field, "")).lower(), item)
+        else:
+            for item in items:
+                unique.setdefault(tuple([str(item.get(f, "")).lower() for f in key_fields]), item)
+        return list(unique.values())
     
     def _regex_extract(self, text: str) -> Dict[str, Any]:
         """Fallback regex-based extraction for basic resume parsing."""
@@ -1342,48 +1761,48 @@ Return ONLY the JSON object, no markdown formatting, no explanation."""
             "warning": "Using basic regex extraction. Results may be incomplete. For better results, ensure GROQ_API_KEY is configured.",
         }
         
-        # Extract name (first line or capitalized words)
-        lines = text.strip().split('\n')
-        if lines:
-            first_line = lines[0].strip()
-            if re.match(r'^[A-Z][a-z]+(\s+[A-Z][a-z]+){1,3}$', first_line):
-                result["name"] = first_line
-                logger.debug("[ResumeParser] Name found")
+        # Extract name (first line or capitalized words); partition stops at
+        # the first newline instead of splitting the whole document
+        first_line = text.lstrip().partition('\n')[0].strip()
+        if _NAME_LINE_RE.match(first_line):
+            result["name"] = first_line
+            logger.debug("[ResumeParser] Name found")
         
         # Extract email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+        email_match = _search_email(_EMAIL_RE, text)
         if email_match:
             result["email"] = email_match.group()
             logger.debug("[ResumeParser] Email found")
         
         # Extract phone
-        phone_patterns = [
-            r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            r'\+?[0-9]{1,3}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}',
-        ]
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, text)
+        phone_start = _phone_search_start(text)
+        for pattern in _PHONE_RES if phone_start != -1 else ():
+            phone_match = pattern.search(text, phone_start)
             if phone_match:
                 result["phone"] = phone_match.group().strip()
                 logger.debug("[ResumeParser] Phone found")
                 break
         
         # Extract skills
-        skills_patterns = [
-            r'(?:skills?|technical skills?|technologies?|proficiencies?)[:\s]*([^\n]+(?:\n(?![A-Z][a-z]+:)[^\n]+)*)',
-            r'(?:programming|languages?)[:\s]*([^\n]+)',
-        ]
-        for pattern in skills_patterns:
-            skills_section = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SKILLS_SECTION_RES:
+            skills_section = pattern.search(text)
             if skills_section:
                 skills_text = skills_section.group(1)
-                skills = re.split(r'[,|•·;\n]', skills_text)
-                skills = [s.strip() for s in skills if s.strip() and len(s.strip()) < 50 and len(s.strip()) > 1]
-                result["skills"].extend(skills[:30])
+                # One strip per candidate; stop once 30 are kept. Repeats
+                # count toward the cap but are only listed once
+                seen_skills: set = set()
+                kept = 0
+                for candidate in _SKILL_SPLIT_RE.split(skills_text):
+                    skill = candidate.strip()
+                    if 1 < len(skill) < 50:
+                        if skill not in seen_skills:
+                            seen_skills.add(skill)
+                            result["skills"].append(skill)
+                        kept += 1
+                        if kept == 30:
+                            break
                 break
         
-        result["skills"] = list(dict.fromkeys(result["skills"]))
-        
         logger.info("[ResumeParser] Regex extraction complete", {
             "has_name": bool(result["name"]),
             "has_email": bool(result["email"]),
@@ -8,6 +8,20 @@ from typing import Any, Dict, Optional
 
 from app.utils.logger import logger
 
+# Size probing serializes straight to UTF-8 bytes when orjson is available;
+# the stdlib fallback uses the same compact, non-ASCII-escaping layout so
+# both measure the same byte count
+try:
+    import orjson
+
+    def _json_size(obj: Any) -> int:
+        return len(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS))
+except ImportError:
+    def _json_size(obj: Any) -> int:
+        return len(
+            json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+
 
 class SnapshotSizeValidator:
     """
@@ -17,7 +31,7 @@ class SnapshotSizeValidator:
     recommending optimization strategies.
     """
     
-    # Size limits (in bytes for JSON string)
+    # Size limits (in bytes of compact UTF-8 JSON)
     MAX_SNAPSHOT_SIZE = 512_000  # 512 KB
     WARNING_SNAPSHOT_SIZE = 256_000  # 256 KB
     MAX_ARRAY_LENGTH = 100  # Maximum items in arrays
@@ -64,8 +78,7 @@ class SnapshotSizeValidator:
         
         try:
             # Serialize to JSON to check size
-            json_str = json.dumps(snapshot, default=str)
-            size_bytes = len(json_str.encode('utf-8'))
+            size_bytes = _json_size(snapshot)
             result["size_bytes"] = size_bytes
             
             # Check size limits
@@ -3,8 +3,11 @@ Comprehensive Logging Module for MatchQuill Backend
 Provides structured logging with request correlation IDs for debugging
 """
 
+import atexit
 import logging
 import json
+import os
+import queue
 import re
 import sys
 import uuid
@@ -13,6 +16,7 @@ from datetime import datetime
 from typing import Optional, Any, Dict
 from functools import wraps
 from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 
 # Context variables for request-scoped data
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
@@ -229,15 +233,25 @@ class MatchQuillLogger:
     
     def __init__(self, name: str = "matchquill"):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        # LOG_LEVEL lets production drop DEBUG records (defaults to DEBUG)
+        level_name = os.getenv("LOG_LEVEL", "DEBUG").strip().upper()
+        self.logger.setLevel(getattr(logging, level_name, logging.DEBUG))
         
         # Remove existing handlers
         self.logger.handlers = []
         
-        # Add structured handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(StructuredFormatter())
-        self.logger.addHandler(handler)
+        # Records are formatted on the calling thread (request context vars
+        # are read there) and the finished line is written to stdout by a
+        # background listener, so a slow stdout never blocks the event loop.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(StructuredFormatter())
+        self.logger.addHandler(queue_handler)
+        
+        self._listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        self._listener.start()
+        # Flush queued records on interpreter exit
+        atexit.register(self._listener.stop)
         
         # Prevent propagation to root logger
         self.logger.propagate = False
@@ -251,6 +265,10 @@ class MatchQuillLogger:
         into the message so no unsanitized extra fields reach the sink.
         See https://codeql.github.com/codeql-query-help/python/py-log-injection/
         """
+        # Skip sanitizing/serializing ``data`` for records that would be dropped
+        if not self.logger.isEnabledFor(level):
+            return
+
         safe_message = _strip_log_newlines(message or "")
 
         if data is not None:
@@ -269,6 +287,10 @@ class MatchQuillLogger:
         if kwargs.get("exc_info"):
             log_kwargs["exc_info"] = kwargs["exc_info"]
         self.logger.log(level, safe_message, **log_kwargs)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Mirror ``logging.Logger.isEnabledFor`` so callers can skip building log payloads."""
+        return self.logger.isEnabledFor(level)
     
     def debug(self, message: str, data: Optional[Dict[str, Any]] = None):
         self._log(logging.DEBUG, message, data)
@@ -413,6 +435,8 @@ def log_function_call(func):
 
 def log_db_operation(operation: str, table: str, data: Optional[Dict[str, Any]] = None):
     """Log database operations"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {"table": table, **(data or {})}
     logger.info(f"[DB] {operation}", log_data)
 
@@ -446,6 +470,8 @@ def log_api_request(method: str, path: str, status_code: int, duration_ms: float
 
 def log_llm_request(model: str, operation: str, tokens_in: int = 0, tokens_out: int = 0, duration_ms: float = 0, data: Optional[Dict[str, Any]] = None):
     """Log LLM API calls"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     log_data = {
         "model": model,
         "operation": operation,
@@ -459,6 +485,9 @@ def log_llm_request(model: str, operation: str, tokens_in: int = 0, tokens_out:
 
 def log_cache_operation(operation: str, key: str, hit: bool = True, data: Optional[Dict[str, Any]] = None):
     """Log cache operations"""
+    # Called on every cache get/set; skip building the payload when filtered
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     log_data = {
         "operation": operation,
         "key": key[:50] + "..." if len(key) > 50 else key,
@@ -470,6 +499,9 @@ def log_cache_operation(operation: str, key: str, hit: bool = True, data: Option
 
 def log_auth_operation(operation: str, user_id: Optional[str] = None, success: bool = True, data: Optional[Dict[str, Any]] = None):
     """Log authentication operations"""
+    level = logging.INFO if success else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
     log_data = {
         "operation": operation,
         "success": success,
@@ -478,7 +510,6 @@ def log_auth_operation(operation: str, user_id: Optional[str] = None, success: b
     if user_id:
         log_data["user_id"] = user_id
     
-    level = logging.INFO if success else logging.WARNING
     logger._log(level, f"[AUTH] {operation}", log_data)
 
 
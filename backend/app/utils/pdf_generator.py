@@ -5,6 +5,7 @@ Generates ATS-friendly resume PDFs using WeasyPrint.
 
 import base64
 import asyncio
+import time
 from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional
@@ -50,6 +51,35 @@ def get_shared_font_configuration() -> FontConfiguration:
     return _font_configuration
 
 
+def _render_warm_up_document() -> None:
+    """Render a trivial document with the shared fonts and base stylesheet."""
+    font_config = get_shared_font_configuration()
+    css = CSS(string=BASE_CSS, font_config=font_config)
+    HTML(string="<p>warm-up</p>").write_pdf(stylesheets=[css], font_config=font_config)
+
+
+async def warm_up_pdf_generator() -> bool:
+    """
+    Pay PDF cold-start costs before the first compile request.
+
+    Loading system fonts and WeasyPrint's first render (lazily built
+    stylesheet and layout caches) dominate first-PDF latency. Running one
+    tiny render on the PDF pool at startup also starts a worker thread.
+    Never raises.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = time.time()
+    try:
+        await loop.run_in_executor(get_pdf_executor(), _render_warm_up_document)
+    except Exception as e:
+        logger.warning("[PDFGenerator] Warm-up render failed", {"error": str(e)})
+        return False
+    logger.info("[PDFGenerator] Warm-up render complete", {
+        "duration_ms": round((time.time() - start_time) * 1000, 2),
+    })
+    return True
+
+
 # Base CSS for ATS-friendly resume
 BASE_CSS = """
 @page {
@@ -335,6 +365,10 @@ class PDFGenerator:
             publications=resume.publications,
         )
     
+    def _render_pdf_sync(self, resume: CompiledResume, max_pages: int = 1) -> bytes:
+        """Render the resume HTML and convert it to PDF (runs in thread pool)."""
+        return self._generate_pdf_sync(self.generate_html(resume), max_pages)
+    
     def _generate_pdf_sync(
         self,
         html_content: str,
@@ -392,8 +426,8 @@ class PDFGenerator:
         """
         Generate PDF from compiled resume asynchronously.
         
-        This method runs the CPU-intensive PDF generation in a thread pool
-        to avoid blocking the async event loop.
+        This method runs the CPU-intensive templating and PDF generation in
+        a thread pool to avoid blocking the async event loop.
         
         Args:
             resume: Compiled resume with selected items
@@ -405,17 +439,16 @@ class PDFGenerator:
         Raises:
             ValueError: If generated PDF exceeds max_pages
         """
-        html_content = self.generate_html(resume)
-        
-        # Run PDF generation in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
+        # Run HTML templating and PDF generation in the thread pool to avoid
+        # blocking; the pool shares memory, so the resume is passed as-is
+        loop = asyncio.get_running_loop()
         executor = get_pdf_executor()
         
         try:
             pdf_bytes = await loop.run_in_executor(
                 executor,
-                self._generate_pdf_sync,
-                html_content,
+                self._render_pdf_sync,
+                resume,
                 max_pages
             )
             return pdf_bytes
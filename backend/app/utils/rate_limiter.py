@@ -74,6 +74,7 @@ class RateLimitConfig:
     
     # AI / LLM endpoints — tighter quotas to control cost and abuse
     AI_ENHANCE_BULLET = ["10/minute", "60/hour"]
+    AI_ENHANCE_BULLETS = ["2/minute", "12/hour"]  # up to MAX_BATCH_BULLETS LLM calls each
     AI_INTERVIEW_PREP = ["5/minute", "20/hour"]
     AI_SUGGEST_SKILLS = ["10/minute", "50/hour"]
     
@@ -4,15 +4,20 @@ Provides caching for repeated API requests with fallback mechanisms.
 Optimized with orjson for faster JSON serialization.
 """
 
+import base64
 import hashlib
-from typing import Optional, Any
+import zlib
+from typing import Optional, Any, Tuple, Type, TypeVar
 from enum import Enum
 
 import redis.asyncio as redis
+from pydantic import BaseModel, ValidationError
 
 from app.config import get_settings
 from app.utils.logger import logger
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # Try to use orjson for faster JSON serialization, fall back to standard json
 try:
     import orjson
@@ -23,17 +28,31 @@ except ImportError:
     _use_orjson = False
     logger.info("orjson not available, using standard json module")
 
+# zstd compresses cached JSON better and faster than zlib; fall back to zlib
+try:
+    import zstandard
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:
+    _zstd_compressor = None
+    _zstd_decompressor = None
 
-def _json_dumps(obj: Any) -> str:
+
+def _json_dumps(obj: Any, by_alias: bool = False) -> str:
     """
     Serialize object to JSON string using fastest available method.
+    Pydantic models are serialized directly by pydantic-core, skipping
+    the intermediate dict from model_dump(mode="json").
     
     Args:
         obj: Object to serialize
+        by_alias: Serialize pydantic models using field aliases
         
     Returns:
         JSON string
     """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump_json(by_alias=by_alias)
     if _use_orjson:
         # orjson returns bytes, need to decode to str
         return orjson.dumps(obj, default=str).decode('utf-8')
@@ -58,6 +77,47 @@ def _json_loads(data: str) -> Any:
         return json.loads(data)
 
 
+# Markers for values stored compressed. Plain JSON values never start with
+# them, so uncompressed entries keep loading unchanged.
+COMPRESSED_VALUE_PREFIX = "z:"
+ZSTD_VALUE_PREFIX = "zs:"
+COMPRESSION_LEVEL = 6
+
+
+def _compress_value(serialized: str) -> str:
+    """
+    Compress a JSON string for storage, with zstd when available.
+
+    The client runs with decode_responses=True, so the compressed bytes are
+    base64-encoded to stay a valid str.
+    """
+    data = serialized.encode("utf-8")
+    if _zstd_compressor is not None:
+        compressed = _zstd_compressor.compress(data)
+        prefix = ZSTD_VALUE_PREFIX
+    else:
+        compressed = zlib.compress(data, COMPRESSION_LEVEL)
+        prefix = COMPRESSED_VALUE_PREFIX
+    return prefix + base64.b64encode(compressed).decode("ascii")
+
+
+def _decompress_value(stored: str) -> Optional[str]:
+    """
+    Reverse _compress_value; plain JSON strings are returned unchanged.
+
+    Returns None for zstd entries when zstandard is not installed.
+    """
+    if stored.startswith(ZSTD_VALUE_PREFIX):
+        if _zstd_decompressor is None:
+            return None
+        compressed = base64.b64decode(stored[len(ZSTD_VALUE_PREFIX):])
+        return _zstd_decompressor.decompress(compressed).decode("utf-8")
+    if stored.startswith(COMPRESSED_VALUE_PREFIX):
+        compressed = base64.b64decode(stored[len(COMPRESSED_VALUE_PREFIX):])
+        return zlib.decompress(compressed).decode("utf-8")
+    return stored
+
+
 class CacheStatus(Enum):
     """Cache operation status."""
     HEALTHY = "healthy"
@@ -184,8 +244,10 @@ def generate_cache_key(user_id: str, job_description: str, prefix: str = "resume
     Generate a namespaced cache key based on user ID and job description hash.
     Format: matchquill:{prefix}:{user_id}:{jd_hash}
     """
-    # Hash the job description to create a consistent key
-    jd_hash = hashlib.sha256(job_description.encode()).hexdigest()[:16]
+    # Hash the job description to create a consistent key. An 8-byte BLAKE2b
+    # digest keeps the key at 16 hex chars and is cheaper than SHA-256 on long
+    # JDs; its values differ from the old SHA-256 prefix.
+    jd_hash = hashlib.blake2b(job_description.encode(), digest_size=8).hexdigest()
     safe_user = user_id.replace(":", "_")
     safe_prefix = prefix.replace(":", "_")
     return f"{CACHE_NAMESPACE}:{safe_prefix}:{safe_user}:{jd_hash}"
@@ -206,12 +268,19 @@ def parse_cache_key_parts(key: str) -> Optional[tuple]:
     return parts[0], parts[1], parts[2], parts[3]
 
 
-async def get_cached(key: str) -> Optional[dict]:
+def _decode_cached_value(key: str, value: str) -> Optional[str]:
+    """Decompress a stored value; None if it cannot be read in this process."""
+    decompressed = _decompress_value(value)
+    if decompressed is None:
+        logger.warning("zstd cache entry but zstandard not installed", {"key": key[:50]})
+    return decompressed
+
+
+async def get_cached_json(key: str) -> Optional[str]:
     """
-    Get cached value from Redis.
+    Fetch a cached JSON string from Redis, decompressing if needed.
     
     Returns None if cache is unavailable or key not found.
-    Logs errors appropriately without failing the request.
     """
     if not redis_client.is_available:
         logger.debug("Cache unavailable, skipping get", {"key": key[:50]})
@@ -226,24 +295,119 @@ async def get_cached(key: str) -> Optional[dict]:
         if value:
             redis_client.record_success()
             logger.debug("Cache hit", {"key": key[:50]})
-            return _json_loads(value)
+            return _decode_cached_value(key, value)
+        else:
+            logger.debug("Cache miss", {"key": key[:50]})
+    except Exception as e:
+        redis_client.record_failure()
+        logger.error(f"Redis get error: {e}", {"key": key[:50]})
+    return None
+
+
+async def get_cached_json_with_ttl(key: str) -> Tuple[Optional[str], int]:
+    """
+    Fetch a cached JSON string and its remaining TTL in one round-trip.
+
+    The TTL follows Redis semantics (-2 missing, -1 no expiry) and lets
+    callers treat entries close to expiry as stale.
+    """
+    if not redis_client.is_available:
+        logger.debug("Cache unavailable, skipping get", {"key": key[:50]})
+        return None, -2
+        
+    try:
+        client = await redis_client.get_client()
+        if not client:
+            return None, -2
+
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.ttl(key)
+            value, ttl = await pipe.execute()
+        if value:
+            redis_client.record_success()
+            logger.debug("Cache hit", {"key": key[:50], "ttl": ttl})
+            return _decode_cached_value(key, value), ttl
         else:
             logger.debug("Cache miss", {"key": key[:50]})
     except Exception as e:
         redis_client.record_failure()
         logger.error(f"Redis get error: {e}", {"key": key[:50]})
+    return None, -2
+
+
+async def get_cached(key: str) -> Optional[dict]:
+    """
+    Get cached value from Redis.
+    
+    Returns None if cache is unavailable or key not found.
+    Logs errors appropriately without failing the request.
+    """
+    raw = await get_cached_json(key)
+    if raw is None:
+        return None
+    try:
+        return _json_loads(raw)
+    except ValueError as e:
+        logger.error(f"Redis get error: {e}", {"key": key[:50]})
     return None
 
 
-async def set_cached(key: str, value: Any, ttl: Optional[int] = None) -> bool:
+def _validate_cached_model(key: str, raw: str, model: Type[ModelT]) -> Optional[ModelT]:
+    """Validate cached JSON in one pydantic-core pass; mismatches are a miss."""
+    try:
+        return model.model_validate_json(raw)
+    except ValidationError as e:
+        logger.warning("Cached value failed validation, ignoring", {
+            "key": key[:50],
+            "model": model.__name__,
+            "error_count": e.error_count(),
+        })
+    return None
+
+
+async def get_cached_model(key: str, model: Type[ModelT]) -> Optional[ModelT]:
+    """
+    Get a cached pydantic model from Redis.
+    
+    The stored JSON is parsed and validated in one pass by pydantic-core
+    (no intermediate dict). Entries that no longer match the model are
+    treated as a miss.
+    """
+    raw = await get_cached_json(key)
+    if raw is None:
+        return None
+    return _validate_cached_model(key, raw, model)
+
+
+async def get_cached_model_with_ttl(
+    key: str,
+    model: Type[ModelT],
+) -> Tuple[Optional[ModelT], int]:
+    """Like get_cached_model, also returning the entry's remaining TTL."""
+    raw, ttl = await get_cached_json_with_ttl(key)
+    if raw is None:
+        return None, ttl
+    return _validate_cached_model(key, raw, model), ttl
+
+
+async def set_cached(
+    key: str,
+    value: Any,
+    ttl: Optional[int] = None,
+    compress: bool = False,
+    by_alias: bool = False,
+) -> bool:
     """
     Set cached value in Redis with optional TTL.
     Also tracks the key in a per-user Redis SET for O(1) invalidation.
     
     Args:
         key: Cache key
-        value: Value to cache (will be JSON serialized)
+        value: Value to cache (dict or pydantic model, JSON serialized)
         ttl: Time to live in seconds (defaults to settings.cache_ttl)
+        compress: Store the JSON compressed, zstd or zlib (get_cached decompresses)
+        by_alias: Serialize pydantic models by alias, i.e. in API wire format
     
     Returns:
         True if cached successfully, False otherwise
@@ -260,29 +424,33 @@ async def set_cached(key: str, value: Any, ttl: Optional[int] = None) -> bool:
             return False
         
         effective_ttl = ttl or settings.cache_ttl
-        serialized = _json_dumps(value)
-        await client.set(
-            key,
-            serialized,
-            ex=effective_ttl,
-        )
+        serialized = _json_dumps(value, by_alias=by_alias)
+        if compress:
+            serialized = _compress_value(serialized)
 
         # Track key in index set for SCAN-free invalidation
         parts = parse_cache_key_parts(key)
         if parts:
             _, prefix, user_id, _ = parts
             index_key = _index_set_key(user_id, prefix)
-            await client.sadd(index_key, key)
+            # SET, SADD and the index TTL read go out in one round-trip
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(key, serialized, ex=effective_ttl)
+                pipe.sadd(index_key, key)
+                pipe.ttl(index_key)
+                _, _, current_ttl = await pipe.execute()
             # Index set lives slightly longer than entries so cleanup can still find them.
             # Never *shorten* an existing TTL — only extend when needed.
             desired_ttl = int(effective_ttl) + 60
-            try:
-                current_ttl = await client.ttl(index_key)
-            except Exception:
-                current_ttl = -1
             # ttl: -2 missing, -1 no expiry, >0 seconds remaining
             if current_ttl is None or current_ttl < 0 or current_ttl < desired_ttl:
                 await client.expire(index_key, desired_ttl)
+        else:
+            await client.set(
+                key,
+                serialized,
+                ex=effective_ttl,
+            )
 
         redis_client.record_success()
         logger.debug("Cache set successfully", {"key": key[:50]})
@@ -293,6 +461,14 @@ async def set_cached(key: str, value: Any, ttl: Optional[int] = None) -> bool:
         return False
 
 
+async def set_cached_compressed(key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    """
+    Set a compressed cached value. Intended for large text payloads
+    (e.g. generated cover letters) where compression saves Redis memory.
+    """
+    return await set_cached(key, value, ttl, compress=True)
+
+
 async def invalidate_user_cache(user_id: str, prefix: str = "resume") -> int:
     """
     Invalidate all cache keys for a user using the set-based index (no SCAN).
@@ -4,7 +4,9 @@ Matches job descriptions to user profile items.
 """
 
 import re
-from collections import Counter
+import hashlib
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 import heapq
 from typing import TypeVar, Generic, Optional, Callable, List, Any
@@ -73,12 +75,15 @@ class RelevanceScorer:
     # without ever letting semantics override a strong keyword match.
     SEMANTIC_SIMILARITY_WEIGHT = 6.0
 
-    # Class-level cache for processed job descriptions
-    _cache: dict = {}
+    # Class-level LRU cache for processed job descriptions. Scorers may be
+    # constructed from worker threads (see CoverLetterGenerator), so mutations
+    # go through `_cache_lock`.
+    _cache: "OrderedDict[str, RelevanceScorer]" = OrderedDict()
     _cache_max_size: int = 100  # Maximum cached job descriptions
+    _cache_lock = threading.Lock()
 
     # Class-level cache for computed text embeddings (JD + profile item text
-    # blobs), MD5-keyed and LRU(FIFO)-bounded exactly like `_cache` above.
+    # blobs), MD5-keyed and FIFO-bounded.
     # Shared across all RelevanceScorer instances/JDs so a profile item's
     # embedding is computed once no matter how many JDs it gets scored against.
     _embedding_cache: dict = {}
@@ -92,26 +97,29 @@ class RelevanceScorer:
         if not job_description:
             return super().__new__(cls)
         
-        # Create a cache key from the job description
-        import hashlib
-        cache_key = hashlib.md5(job_description.lower().encode(), usedforsecurity=False).hexdigest()
+        cache_key = cls._jd_cache_key(job_description)
         
-        # Return cached instance if available
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
-        
-        # Create new instance
-        instance = super().__new__(cls)
-        
-        # Cache the instance (with simple LRU eviction)
-        if len(cls._cache) >= cls._cache_max_size:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(cls._cache))
-            del cls._cache[oldest_key]
-        
-        cls._cache[cache_key] = instance
-        instance._cache_key = cache_key
-        return instance
+        with cls._cache_lock:
+            # Return cached instance if available, marking it most recently used
+            # so a hot posting isn't evicted by a burst of one-off JDs.
+            instance = cls._cache.get(cache_key)
+            if instance is not None:
+                cls._cache.move_to_end(cache_key)
+                return instance
+            
+            instance = super().__new__(cls)
+            
+            if len(cls._cache) >= cls._cache_max_size:
+                cls._cache.popitem(last=False)
+            
+            cls._cache[cache_key] = instance
+            instance._cache_key = cache_key
+            return instance
+
+    @staticmethod
+    def _jd_cache_key(job_description: str) -> str:
+        """Case-insensitive cache key for a job description (BLAKE2b, 128-bit)."""
+        return hashlib.blake2b(job_description.lower().encode(), digest_size=16).hexdigest()
     
     def __init__(self, job_description: str):
         """
@@ -149,8 +157,9 @@ class RelevanceScorer:
     @classmethod
     def clear_cache(cls) -> int:
         """Clear the job description cache. Returns number of entries cleared."""
-        count = len(cls._cache)
-        cls._cache.clear()
+        with cls._cache_lock:
+            count = len(cls._cache)
+            cls._cache.clear()
         return count
 
     @classmethod
@@ -166,14 +175,12 @@ class RelevanceScorer:
     def _get_cached_embedding(cls, text: str) -> Optional[list]:
         """
         Return a cached embedding for `text`, computing and caching it on
-        miss. MD5-keyed and FIFO-bounded, mirroring the `_cache` pattern used
-        for job description instances above. Returns None (no crash) if the
+        miss. MD5-keyed and FIFO-bounded. Returns None (no crash) if the
         embedding backend is unavailable.
         """
         if not text or not text.strip():
             return None
 
-        import hashlib
         cache_key = hashlib.md5(text.strip().lower().encode(), usedforsecurity=False).hexdigest()
 
         if cache_key in cls._embedding_cache:
@@ -185,7 +192,7 @@ class RelevanceScorer:
 
         if len(cls._embedding_cache) >= cls._embedding_cache_max_size:
             oldest_key = next(iter(cls._embedding_cache))
-            del cls._embedding_cache[oldest_key]
+            cls._embedding_cache.pop(oldest_key, None)
 
         cls._embedding_cache[cache_key] = vector
         return vector
@@ -34,8 +34,19 @@ class RequestDeduplicator:
         self._lock = asyncio.Lock()
 
     def _generate_request_hash(self, *args, **kwargs) -> str:
-        content = f"args:{str(args)}|kwargs:{str(sorted(kwargs.items()))}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        # Args are often large prompt strings: hash their UTF-8 bytes directly
+        # (no repr() copy) with BLAKE2b; type tags and length prefixes keep
+        # fields unambiguous
+        hasher = hashlib.blake2b(digest_size=8)
+        fields = [
+            (b"s", arg.encode()) if isinstance(arg, str) else (b"r", repr(arg).encode())
+            for arg in args
+        ]
+        fields.extend((b"k", repr(item).encode()) for item in sorted(kwargs.items()))
+        for tag, data in fields:
+            hasher.update(tag + len(data).to_bytes(8, "little"))
+            hasher.update(data)
+        return hasher.hexdigest()
 
     async def execute(self, key_prefix: str, func, *args, **kwargs) -> Any:
         request_hash = self._generate_request_hash(*args, **kwargs)
@@ -0,0 +1,10 @@
+"""
+Server-Sent Events helpers for streaming endpoints.
+"""
+
+import json
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Format one server-sent event; JSON keeps newlines in deltas intact."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
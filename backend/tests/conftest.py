@@ -1,3 +1,8 @@
+import os
+
+# Keep TestClient startup off the network: no Groq/frontend warm-up calls
+os.environ["STARTUP_WARMUP"] = "false"
+
 import pytest
 from fastapi.testclient import TestClient
 
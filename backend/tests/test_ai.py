@@ -58,7 +58,7 @@ def mock_db_auth() -> Generator[AsyncMock, None, None]:
 @pytest.fixture
 def client(mock_groq_client: AsyncMock, mock_db_auth: AsyncMock) -> Generator[TestClient, None, None]:
     """Create test client with mocked GroqClient and DB auth."""
-    with patch("app.routers.ai.GroqClient", return_value=mock_groq_client):
+    with patch("app.routers.ai.get_groq_client", return_value=mock_groq_client):
         with TestClient(app) as c:
             yield c
 
@@ -81,6 +81,19 @@ def test_enhance_bullet_success(client: TestClient, valid_token: str, mock_groq_
     mock_groq_client.enhance_bullet.assert_called_once()
 
 
+def test_enhance_bullets_success(client: TestClient, valid_token: str, mock_groq_client: AsyncMock) -> None:
+    """Test batch bullet enhancement returns one result per bullet."""
+    mock_groq_client.enhance_bullets.return_value = ["Better one", "Better two"]
+    response = client.post(
+        "/api/py/ai/enhance-bullets",
+        json={"bullets": ["Did one", "Did two"]},
+        headers={"Authorization": f"Bearer {valid_token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["enhanced_bullets"] == ["Better one", "Better two"]
+    mock_groq_client.enhance_bullets.assert_called_once()
+
+
 def test_interview_prep_success(client: TestClient, valid_token: str, mock_groq_client: AsyncMock) -> None:
     """Test successful interview prep generation with authentication."""
     response = client.post(
@@ -94,6 +107,24 @@ def test_interview_prep_success(client: TestClient, valid_token: str, mock_groq_
     mock_groq_client.generate_interview_prep.assert_called_once()
 
 
+def test_interview_prep_stream(client: TestClient, valid_token: str, mock_groq_client: AsyncMock) -> None:
+    """Test streamed interview prep emits one SSE event per question."""
+    async def fake_stream(candidate_info, job_description=None):
+        yield {"question": "Q1", "suggested_answer": "A1", "key_points": []}
+        yield {"question": "Q2", "suggested_answer": "A2", "key_points": []}
+
+    mock_groq_client.stream_interview_prep = fake_stream
+    response = client.post(
+        "/api/py/ai/interview-prep/stream",
+        json={"candidate_info": "Some info"},
+        headers={"Authorization": f"Bearer {valid_token}"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.count("event: question") == 2
+    assert 'event: done\ndata: {"count": 2}' in response.text
+
+
 def test_suggest_skills_success(client: TestClient, valid_token: str, mock_groq_client: AsyncMock) -> None:
     """Test successful skill suggestion with authentication."""
     response = client.post(
@@ -55,7 +55,7 @@ def client(mock_groq_client, mock_db_auth):
     """Create test client with mocked dependencies."""
     from app.middleware.auth import clear_db_auth_cache
     clear_db_auth_cache()
-    with patch("app.routers.ai.GroqClient", return_value=mock_groq_client):
+    with patch("app.routers.ai.get_groq_client", return_value=mock_groq_client):
         with TestClient(app) as c:
             yield c
     clear_db_auth_cache()
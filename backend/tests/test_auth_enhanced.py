@@ -187,6 +187,32 @@ class TestVerifyAuthTokenWithDB:
                     mock_service.validate_token.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_verify_auth_with_db_caches_until_token_expiry(
+        self, mock_credentials, mock_settings
+    ):
+        """Cache TTL follows the JWT exp claim, capped at the max TTL."""
+        import time
+        from app.middleware import auth
+
+        mock_service = AsyncMock()
+        mock_service.validate_token.return_value = None
+        mock_service.close = AsyncMock()
+
+        with patch("app.middleware.auth.get_settings", return_value=mock_settings):
+            with patch("app.middleware.auth.decode_service_jwt") as mock_decode, \
+                 patch("app.services.profile_service.ProfileService", return_value=mock_service):
+                mock_decode.return_value = {"sub": "user123", "exp": time.time() + 300}
+                await verify_auth_token_with_db(mock_credentials)
+                _, expires_at = next(iter(auth._DB_AUTH_CACHE.values()))
+                assert 250 < expires_at - time.monotonic() <= 300
+
+                clear_db_auth_cache()
+                mock_decode.return_value = {"sub": "user123", "exp": time.time() + 3600}
+                await verify_auth_token_with_db(mock_credentials)
+                _, expires_at = next(iter(auth._DB_AUTH_CACHE.values()))
+                assert expires_at - time.monotonic() <= auth._DB_AUTH_CACHE_MAX_TTL_SECONDS
+
 class TestOptionalAuth:
     """Tests for optional_auth function."""
 
@@ -71,6 +71,7 @@ def client(sample_profile: UserProfile):
             ),
         )
     )
+    mock_compiler.get_cached_response_json = AsyncMock(return_value=None)
     mock_compiler.get_available_templates.return_value = {
         "template1": {"description": "desc"}
     }
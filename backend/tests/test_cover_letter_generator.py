@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import patch, AsyncMock
 from datetime import datetime
 from app.services.cover_letter_generator import CoverLetterGenerator
+from app.models.cover_letter import CoverLetterResponse
 from app.models.user import UserProfile, Experience, Project, Education, Skill, UserSettings
 
 
@@ -52,7 +53,7 @@ def sample_profile():
 
 @pytest.fixture
 def mock_groq_client():
-    with patch("app.services.cover_letter_generator.GroqClient") as mock:
+    with patch("app.services.cover_letter_generator.get_groq_client") as mock:
         instance = mock.return_value
         # Use AsyncMock for async methods
         instance.generate_cover_letter = AsyncMock(return_value=("Generated Letter", "model-id"))
@@ -61,8 +62,8 @@ def mock_groq_client():
 
 @pytest.fixture
 def mock_cache():
-    with patch("app.services.cover_letter_generator.get_cached") as mock_get, \
-         patch("app.services.cover_letter_generator.set_cached") as mock_set:
+    with patch("app.services.cover_letter_generator.get_cached_model") as mock_get, \
+         patch("app.services.cover_letter_generator.set_cached_compressed") as mock_set:
         mock_get.return_value = None
         yield mock_get, mock_set
 
@@ -83,18 +84,61 @@ async def test_generate(generator, sample_profile, mock_groq_client):
 @pytest.mark.asyncio
 async def test_generate_cached(generator, sample_profile, mock_cache, mock_groq_client):
     mock_get, mock_set = mock_cache
-    mock_get.return_value = {
-        "success": True,
-        "cover_letter": "Cached Letter",
-        "model_used": "cached-model",
-        "word_count": 100,
-        "profile_fields_used": []
-    }
+    mock_get.return_value = CoverLetterResponse(
+        success=True,
+        cover_letter="Cached Letter",
+        model_used="cached-model",
+        word_count=100,
+        profile_fields_used=[],
+    )
     
     response = await generator.generate(sample_profile, "Job Description")
     assert response.cover_letter == "Cached Letter"
     mock_groq_client.generate_cover_letter.assert_not_called()
 
+@pytest.mark.asyncio
+async def test_stream_yields_deltas_and_caches(generator, sample_profile, mock_cache, mock_groq_client):
+    mock_get, mock_set = mock_cache
+
+    async def fake_stream(**kwargs):
+        for text in ["Dear ", "Hiring ", "Manager"]:
+            yield text
+
+    mock_groq_client.stream_cover_letter = fake_stream
+    mock_groq_client.model = "model-id"
+
+    deltas = [d async for d in generator.stream(sample_profile, "Job Description")]
+
+    assert deltas == ["Dear ", "Hiring ", "Manager"]
+    cached_response = mock_set.call_args[0][1]
+    assert cached_response.cover_letter == "Dear Hiring Manager"
+    assert cached_response.word_count == 3
+
+@pytest.mark.asyncio
+async def test_stream_returns_cached_letter(generator, sample_profile, mock_cache, mock_groq_client):
+    mock_get, mock_set = mock_cache
+    mock_get.return_value = CoverLetterResponse(success=True, cover_letter="Cached Letter")
+
+    deltas = [d async for d in generator.stream(sample_profile, "Job Description")]
+
+    assert deltas == ["Cached Letter"]
+    mock_set.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_stream_error_fails_operation(generator, sample_profile, mock_groq_client):
+    async def failing_stream(**kwargs):
+        yield "Dear "
+        raise Exception("Groq Error")
+
+    mock_groq_client.stream_cover_letter = failing_stream
+
+    with patch("app.services.cover_letter_generator.logger") as mock_logger:
+        with pytest.raises(Exception, match="Groq Error"):
+            [d async for d in generator.stream(sample_profile, "Job Description")]
+
+    mock_logger.fail_operation.assert_called_once()
+    mock_logger.end_operation.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_generate_error(generator, sample_profile, mock_groq_client):
     mock_groq_client.generate_cover_letter.side_effect = Exception("Groq Error")
@@ -102,3 +146,21 @@ async def test_generate_error(generator, sample_profile, mock_groq_client):
     response = await generator.generate(sample_profile, "Job Description")
     assert not response.success
     assert "Groq Error" in response.error
+
+@pytest.mark.asyncio
+async def test_generate_without_cache_skips_lookup(generator, sample_profile, mock_cache, mock_groq_client):
+    mock_get, mock_set = mock_cache
+
+    response = await generator.generate(sample_profile, "Job Description", use_cache=False)
+
+    assert response.success
+    mock_get.assert_not_called()
+    mock_set.assert_not_called()
+    mock_groq_client.format_candidate_info.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_generate_reports_profile_fields_used(generator, sample_profile):
+    response = await generator.generate(sample_profile, "Python developer building APIs", use_cache=False)
+
+    # Sample profile has no publications, so that section is omitted
+    assert response.profile_fields_used == ["experiences", "projects", "skills", "educations"]
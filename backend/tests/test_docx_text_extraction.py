@@ -0,0 +1,41 @@
+"""
+Tests for DOCX text extraction on resume upload.
+"""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from app.services.resume_parser import ResumeParser
+
+
+def _docx_bytes() -> bytes:
+    """Build a DOCX with a table between two paragraphs via python-docx."""
+    docx = pytest.importorskip("docx")
+    doc = docx.Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("Acme Corp\t2020 - 2023")
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Languages"
+    table.cell(0, 1).text = "Python, Go"
+    table.cell(1, 0).text = "   "
+    table.cell(1, 1).text = "Docker"
+    doc.add_paragraph("   ")
+    doc.add_paragraph("Education after table")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def test_docx_text_keeps_document_order() -> None:
+    text = ResumeParser()._extract_text_from_docx(_docx_bytes())
+
+    assert text.split("\n") == [
+        "Jane Doe",
+        "Acme Corp\t2020 - 2023",
+        "Languages | Python, Go",
+        "Docker",
+        "Education after table",
+    ]
@@ -20,6 +20,7 @@ def mock_profile_service():
 def mock_compiler():
     mock = MagicMock()
     mock.compile = AsyncMock()
+    mock.get_cached_response_json = AsyncMock(return_value=None)
     mock.get_available_templates.return_value = {"template1": {"description": "desc"}}
     return mock
 
@@ -88,6 +89,23 @@ def test_compile_resume(client, mock_profile_service, mock_compiler, sample_prof
     assert response.status_code == 200
     assert response.json()["success"]
     assert response.json()["pdfBase64"] == "base64pdf"
+    # The route already missed the cache, so compile() must not read it again
+    assert mock_compiler.compile.call_args.kwargs["refresh"] is True
+
+def test_compile_resume_serves_cached_json(client, mock_profile_service, mock_compiler, sample_profile):
+    mock_profile_service.get_profile.return_value = sample_profile
+    cached = ResumeResponse(success=True, pdf_base64="cachedpdf").model_dump_json(by_alias=True)
+    mock_compiler.get_cached_response_json.return_value = cached
+
+    response = client.post("/api/py/compile", json={
+        "authToken": "valid_token",
+        "jobDescription": "A" * 60
+    })
+
+    assert response.status_code == 200
+    assert response.content == cached.encode()
+    assert response.json()["pdfBase64"] == "cachedpdf"
+    mock_compiler.compile.assert_not_called()
 
 def test_compile_resume_invalid_jd(client):
     response = client.post("/api/py/compile", json={
@@ -2,7 +2,7 @@
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from datetime import datetime
-from app.services.groq_client import GroqClient
+from app.services.groq_client import GroqClient, _json_loads
 from app.models.user import Experience, Project, Skill, Education
 
 @pytest.fixture
@@ -44,6 +44,24 @@ async def test_generate_cover_letter(client, mock_groq):
     assert kwargs["messages"][0]["role"] == "system"
     assert kwargs["messages"][1]["role"] == "user"
 
+@pytest.mark.asyncio
+async def test_stream_cover_letter(client, mock_groq):
+    def chunk(text):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    async def fake_stream():
+        for text in ["Dear ", None, "Hiring ", "Manager"]:
+            yield chunk(text)
+
+    client.client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+    deltas = [d async for d in client.stream_cover_letter("Candidate Info", "Job Description")]
+
+    assert deltas == ["Dear ", "Hiring ", "Manager"]
+    args, kwargs = client.client.chat.completions.create.call_args
+    assert kwargs["stream"] is True
+    assert kwargs["model"] == "llama-3-8b-8192"
+
 @pytest.mark.asyncio
 async def test_enhance_bullet(client, mock_groq):
     mock_response = MagicMock()
@@ -53,6 +71,63 @@ async def test_enhance_bullet(client, mock_groq):
     result = await client.enhance_bullet("Original Bullet")
     assert result == "Enhanced Bullet"
 
+@pytest.mark.asyncio
+async def test_enhance_bullets_keeps_original_on_failure(client, mock_groq):
+    async def fake_enhance(bullet, job_description=None):
+        if bullet == "bad":
+            raise RuntimeError("LLM error")
+        return bullet.upper()
+
+    client.enhance_bullet = fake_enhance
+    client._enhance_bullets_batched = AsyncMock(return_value=None)
+
+    result = await client.enhance_bullets(["one", "bad", "two"])
+    assert result == ["ONE", "bad", "TWO"]
+
+@pytest.mark.asyncio
+async def test_enhance_bullets_uses_single_batched_call(client, mock_groq):
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content='{"bullets": ["Led one", "Built two"]}'))]
+    client.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    result = await client.enhance_bullets(["did one", "did two"])
+
+    assert result == ["Led one", "Built two"]
+    client.client.chat.completions.create.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_enhance_bullets_falls_back_on_count_mismatch(client, mock_groq):
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content='{"bullets": ["Only one"]}'))]
+    client.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    assert await client._enhance_bullets_batched(["did one", "did two"]) is None
+
+@pytest.mark.asyncio
+async def test_enhance_bullet_served_from_llm_cache(client, mock_groq):
+    client.client.chat.completions.create = AsyncMock()
+
+    with patch("app.services.groq_client.get_cached", AsyncMock(return_value={"content": "Cached Bullet"})):
+        result = await client._enhance_bullet_internal("Original Bullet")
+
+    assert result == "Cached Bullet"
+    client.client.chat.completions.create.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_llm_cache_stores_new_completion(client, mock_groq):
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content='{"skills": ["Go"]}'))]
+    client.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    with patch("app.services.groq_client.get_cached", AsyncMock(return_value=None)), \
+         patch("app.services.groq_client.set_cached", AsyncMock()) as mock_set:
+        result = await client._suggest_skills_internal("I wrote Go services")
+
+    assert result == ["Go"]
+    key, value = mock_set.call_args[0]
+    assert key.startswith("matchquill:llm:")
+    assert value == {"content": '{"skills": ["Go"]}'}
+
 @pytest.mark.asyncio
 async def test_enhance_bullet_with_jd(client, mock_groq):
     mock_response = MagicMock()
@@ -85,6 +160,71 @@ async def test_generate_interview_prep_failure(client, mock_groq):
     result = await client.generate_interview_prep("Candidate Info")
     assert result == []
 
+@pytest.mark.asyncio
+async def test_stream_interview_prep_yields_questions_incrementally(client, mock_groq):
+    content = (
+        '{"questions": [{"question": "Why {us}?", "suggested_answer": "A \\"quote\\"", "key_points": ["]"]},'
+        ' {"question": "Q2", "suggested_answer": "A2", "key_points": []}]}'
+    )
+
+    def chunk(text):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    async def fake_stream():
+        for i in range(0, len(content), 5):
+            yield chunk(content[i:i + 5])
+
+    client.client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+    questions = [q async for q in client.stream_interview_prep("Candidate Info", "Job Description")]
+
+    assert [q["question"] for q in questions] == ["Why {us}?", "Q2"]
+    assert questions[0]["suggested_answer"] == 'A "quote"'
+    args, kwargs = client.client.chat.completions.create.call_args
+    assert kwargs["stream"] is True
+    assert kwargs["response_format"] == {"type": "json_object"}
+
+@pytest.mark.asyncio
+async def test_stream_interview_prep_does_not_repeat_after_skipped_fragment(client, mock_groq):
+    content = (
+        '{"questions": [{"question": "Q1", "key_points": []},'
+        ' {"question": "Q2", "key_points": []}]}'
+    )
+    def flaky_loads(text):
+        # The incremental parse of the first item fails; the full parse works
+        if text == '{"question": "Q1", "key_points": []}':
+            raise ValueError("bad fragment")
+        return _json_loads(text)
+
+    async def fake_stream():
+        yield MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+    client.client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+    with patch("app.services.groq_client._json_loads", flaky_loads):
+        questions = [q async for q in client.stream_interview_prep("Candidate Info")]
+
+    assert [q["question"] for q in questions] == ["Q2"]
+
+@pytest.mark.asyncio
+async def test_stream_interview_prep_only_yields_questions_array(client, mock_groq):
+    content = (
+        '{"notes": [{"question": "not a question"}],'
+        ' "questions": [{"question": "Q1", "key_points": []}, {"question": "Q2", "key_points": []}]}'
+    )
+
+    async def fake_stream():
+        for i in range(0, len(content), 7):
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=content[i:i + 7]))])
+
+    client.client.chat.completions.create = AsyncMock(return_value=fake_stream())
+
+    questions = [q async for q in client.stream_interview_prep("Candidate Info")]
+
+    assert [q["question"] for q in questions] == ["Q1", "Q2"]
+    system_prompt = client.client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+    assert '"questions"' in system_prompt
+
 @pytest.mark.asyncio
 async def test_suggest_skills(client, mock_groq):
     mock_content = '{"skills": ["Python", "Docker"]}'
@@ -144,3 +284,20 @@ def test_format_candidate_info(client) -> None:
     assert "Proj 1" in formatted
     assert "Python" in formatted
     assert "Uni" in formatted
+
+
+def test_format_candidate_info_is_memoized(client) -> None:
+    from app.services.groq_client import _render_candidate_info
+
+    skills = [Skill(id="s1", name="Python", category="Lang")]
+    _render_candidate_info.cache_clear()
+
+    first = client.format_candidate_info("Jane", "jane@example.com", [], [], skills, [])
+    second = client.format_candidate_info("Jane", "jane@example.com", [], [], skills, [])
+
+    assert first == second
+    assert _render_candidate_info.cache_info().hits == 1
+
+    # Changed profile content renders fresh output
+    skills.append(Skill(id="s2", name="Rust", category="Lang"))
+    assert "Rust" in client.format_candidate_info("Jane", "jane@example.com", [], [], skills, [])
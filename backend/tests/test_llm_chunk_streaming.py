@@ -0,0 +1,61 @@
+"""
+Tests for LLM chunk extraction and chunk-result merging in the resume parser.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.resume_parser import ResumeParser
+
+
+def _stream_client(deltas):
+    def chunk(text):
+        return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    async def fake_stream():
+        yield MagicMock(choices=[])
+        for text in deltas:
+            yield chunk(text)
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=fake_stream())
+    return client
+
+
+@pytest.mark.asyncio
+async def test_chunk_extract_joins_streamed_deltas() -> None:
+    client = _stream_client(['```json\n{"name": "Jane', None, ' Doe", ', '"skills": ["Go"]}\n```'])
+
+    with patch("app.services.resume_parser.get_groq_client", return_value=client):
+        result = await ResumeParser()._llm_extract_chunk("Jane Doe\nGo", ["all"], True)
+
+    assert result == {"name": "Jane Doe", "skills": ["Go"]}
+    kwargs = client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+
+
+def test_merge_chunk_results_dedupes_skills_and_certs_in_order() -> None:
+    merged = ResumeParser()._merge_chunk_results([
+        {"skills": ["Python", "Go", ""], "certifications": ["CKA"]},
+        {"skills": ["Go", "python", {"name": "SQL"}], "certifications": ["CKA", "AWS SA"]},
+        {"skills": [{"name": "SQL"}, "Python"]},
+    ])
+
+    assert merged["skills"] == ["Python", "Go", "python", {"name": "SQL"}]
+    assert merged["certifications"] == ["CKA", "AWS SA"]
+
+
+def test_deduplicate_list_keeps_first_case_insensitive_match() -> None:
+    parser = ResumeParser()
+    first = {"company": "Acme", "title": "Engineer"}
+    projects = [{"name": "Atlas"}, {"name": "atlas", "url": "x"}, {"name": "Beacon"}]
+
+    assert parser._deduplicate_list(projects, "name") == [projects[0], projects[2]]
+    assert parser._deduplicate_list(
+        [first, {"company": "ACME", "title": "engineer"}, {"company": "Acme", "title": "Lead"}],
+        "company",
+        "title",
+    ) == [first, {"company": "Acme", "title": "Lead"}]
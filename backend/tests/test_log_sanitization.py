@@ -2,6 +2,9 @@
 Tests for log sanitization utilities.
 """
 
+import logging
+from unittest.mock import patch
+
 from starlette.datastructures import Headers
 
 from app.utils.logger import (
@@ -12,6 +15,9 @@ from app.utils.logger import (
     sanitize_dict,
     _safe_log_value,
     log_api_request,
+    log_auth_operation,
+    log_cache_operation,
+    logger,
 )
 
 
@@ -138,3 +144,43 @@ class TestLogApiRequest:
         # Should not raise; path CR/LF stripped before logging
         log_api_request("GET", "/api/foo\nINJECTED", 200, 1.0)
         log_api_request("POST", "/api/bar\r\nX", 201, 2.0)
+
+
+
+class TestLevelGuard:
+    def test_disabled_level_skips_payload_sanitization(self):
+        """Records below the logger level return before sanitizing the data dict."""
+        previous = logger.logger.level
+        logger.logger.setLevel(logging.INFO)
+        try:
+            assert not logger.isEnabledFor(logging.DEBUG)
+            assert logger.isEnabledFor(logging.INFO)
+            with patch("app.utils.logger.sanitize_dict") as mock_sanitize:
+                logger.debug("dropped", {"token": "secret"})
+                mock_sanitize.assert_not_called()
+        finally:
+            logger.logger.setLevel(previous)
+
+    def test_helpers_return_before_building_payload(self):
+        """Filtered cache/auth helpers never reach the logger."""
+        previous = logger.logger.level
+        logger.logger.setLevel(logging.ERROR)
+        try:
+            with patch.object(logger, "_log") as mock_log:
+                log_cache_operation("get", "k" * 80, hit=False)
+                log_auth_operation("compile:auth_failed", success=False)
+                mock_log.assert_not_called()
+        finally:
+            logger.logger.setLevel(previous)
+
+
+class TestQueuedOutput:
+    def test_records_are_formatted_before_enqueue(self):
+        """The request thread formats records; only finished lines hit the queue."""
+        from logging.handlers import QueueHandler
+
+        handler = logger.logger.handlers[0]
+        assert isinstance(handler, QueueHandler)
+        record = logging.LogRecord("matchquill", logging.INFO, __file__, 1, "queued", None, None)
+        prepared = handler.prepare(record)
+        assert '"message": "queued"' in prepared.getMessage()
@@ -0,0 +1,47 @@
+"""
+Tests for the content-addressed cache of parsed uploads.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.resume_parser import ResumeParser, _parse_cache_key
+
+
+def test_parse_cache_key_depends_on_content_extension_and_type() -> None:
+    key = _parse_cache_key(b"resume bytes", "cv.pdf", "resume")
+
+    assert key == _parse_cache_key(b"resume bytes", "other-name.pdf", "resume")
+    assert key != _parse_cache_key(b"resume bytes!", "cv.pdf", "resume")
+    assert key != _parse_cache_key(b"resume bytes", "cv.docx", "resume")
+    assert key != _parse_cache_key(b"resume bytes", "cv.pdf", "cover-letter")
+    # Three segments only, so set_cached does not index it under a user
+    assert key.count(":") == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_extraction() -> None:
+    cached = {"name": "Jane Doe", "extraction_method": "llm"}
+
+    with patch("app.services.resume_parser.get_cached", AsyncMock(return_value=cached)), \
+         patch.object(ResumeParser, "_extract_pdf_document") as mock_extract:
+        result = await ResumeParser().parse_file(b"%PDF-1.7", "resume.pdf")
+
+    assert result == cached
+    mock_extract.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_only_llm_results_are_cached() -> None:
+    parser = ResumeParser()
+
+    with patch("app.services.resume_parser.set_cached", AsyncMock()) as mock_set:
+        await parser._cache_parse_result("key", {"extraction_method": "regex"})
+        mock_set.assert_not_called()
+
+        await parser._cache_parse_result("key", {"extraction_method": "llm"})
+        mock_set.assert_awaited_once()
+        assert mock_set.call_args.kwargs["compress"] is True
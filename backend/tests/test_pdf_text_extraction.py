@@ -0,0 +1,157 @@
+"""
+Tests for PDF text extraction on resume upload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.services import resume_parser
+from app.services.resume_parser import ResumeParser
+
+
+def _multi_page_pdf_bytes(pages: int) -> bytes:
+    """Build a PDF with one distinct line of text per page via PyMuPDF."""
+    fitz = pytest.importorskip("fitz")
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page marker {i + 1} " + "experience " * 20)
+    pdf_bytes = doc.tobytes()
+    doc.close()
+    return pdf_bytes
+
+
+@pytest.fixture
+def pdf_text_pool():
+    with patch.object(resume_parser.get_settings(), "pdf_parse_workers", 2):
+        resume_parser.close_pdf_text_pool()
+        yield
+        resume_parser.close_pdf_text_pool()
+
+
+def test_parallel_extraction_matches_sequential(pdf_text_pool) -> None:
+    pdf_bytes = _multi_page_pdf_bytes(5)
+    parser = ResumeParser()
+
+    with patch.object(resume_parser, "get_pdf_text_pool", return_value=None):
+        sequential = parser._extract_text_from_pdf(pdf_bytes)
+    # Force a real pool even on single-CPU runners
+    with patch("os.cpu_count", return_value=4):
+        assert resume_parser.get_pdf_text_pool() is not None
+        parallel = parser._extract_text_from_pdf(pdf_bytes)
+
+    assert parallel == sequential
+    positions = [parallel.index(f"Page marker {i}") for i in range(1, 6)]
+    assert positions == sorted(positions)
+
+
+def test_short_pdf_stays_in_process(pdf_text_pool) -> None:
+    pdf_bytes = _multi_page_pdf_bytes(resume_parser.PDF_PARALLEL_MIN_PAGES - 1)
+
+    with patch.object(resume_parser, "get_pdf_text_pool") as mock_pool:
+        text = ResumeParser()._extract_text_from_pdf(pdf_bytes)
+
+    mock_pool.assert_not_called()
+    assert "Page marker 2" in text
+
+
+def test_pool_failure_falls_back_to_sequential(pdf_text_pool) -> None:
+    pdf_bytes = _multi_page_pdf_bytes(4)
+
+    class BrokenPool:
+        def map(self, *args):
+            raise OSError("no semaphores")
+
+    with patch.object(resume_parser, "get_pdf_text_pool", return_value=BrokenPool()), \
+         patch.object(resume_parser, "_pdf_text_pool_workers", 2):
+        text = ResumeParser()._extract_text_from_pdf(pdf_bytes)
+
+    assert "Page marker 4" in text
+
+
+def test_pool_construction_failure_falls_back_and_is_remembered(pdf_text_pool) -> None:
+    pdf_bytes = _multi_page_pdf_bytes(4)
+    parser = ResumeParser()
+
+    with patch("os.cpu_count", return_value=4), \
+         patch.object(
+             resume_parser,
+             "ProcessPoolExecutor",
+             side_effect=OSError(38, "Function not implemented"),
+         ) as mock_pool_cls:
+        first = parser._extract_text_from_pdf(pdf_bytes)
+        second = parser._extract_text_from_pdf(pdf_bytes)
+
+    assert "Page marker 4" in first
+    assert second == first
+    assert mock_pool_cls.call_count == 1
+    assert resume_parser.get_pdf_text_pool() is None
+
+
+
+def test_pymupdf_lock_is_released_while_pool_workers_run(pdf_text_pool) -> None:
+    pdf_bytes = _multi_page_pdf_bytes(4)
+    lock_held_during_map = []
+
+    class InlinePool:
+        def map(self, func, *iterables):
+            lock_held_during_map.append(resume_parser._PYMUPDF_LOCK.locked())
+            return [func(*args) for args in zip(*iterables)]
+
+    with patch.object(resume_parser, "get_pdf_text_pool", return_value=InlinePool()), \
+         patch.object(resume_parser, "_pdf_text_pool_workers", 2):
+        text, images = ResumeParser()._extract_pdf_document(pdf_bytes)
+
+    assert lock_held_during_map == [False]
+    assert "Page marker 4" in text
+    assert images == []
+
+
+def test_concurrent_pool_creation_builds_one_pool(pdf_text_pool) -> None:
+    barrier = threading.Barrier(4)
+    pools = []
+
+    def get_pool():
+        barrier.wait()
+        pools.append(resume_parser.get_pdf_text_pool())
+
+    with patch("os.cpu_count", return_value=4), \
+         patch.object(resume_parser, "ProcessPoolExecutor") as mock_pool_cls:
+        threads = [threading.Thread(target=get_pool) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_pool_cls.call_count == 1
+    assert all(pool is pools[0] for pool in pools)
+
+def test_parse_file_extracts_off_event_loop() -> None:
+    loop_thread_id = threading.get_ident()
+    extract_thread_ids = []
+
+    def fake_extract(self, file_content):
+        extract_thread_ids.append(threading.get_ident())
+        return "", []
+
+    with patch.object(ResumeParser, "_extract_pdf_document", fake_extract):
+        result = asyncio.run(ResumeParser().parse_file(b"%PDF-1.7", "resume.pdf"))
+
+    assert "error" in result
+    assert extract_thread_ids and extract_thread_ids[0] != loop_thread_id
+
+
+def test_pdf_document_is_opened_once_for_text_and_images() -> None:
+    pdf_bytes = _multi_page_pdf_bytes(2)
+
+    with patch.object(resume_parser.fitz, "open", wraps=resume_parser.fitz.open) as mock_open:
+        text, images = ResumeParser()._extract_pdf_document(pdf_bytes)
+
+    assert mock_open.call_count == 1
+    assert "Page marker 2" in text
+    assert images == []
@@ -0,0 +1,31 @@
+"""
+Tests for plain-text/markdown upload decoding.
+"""
+
+from __future__ import annotations
+
+import codecs
+
+from app.services.resume_parser import ResumeParser
+
+
+def test_utf8_bom_is_stripped() -> None:
+    content = codecs.BOM_UTF8 + "Jane Doe\nEngineer".encode("utf-8")
+
+    assert ResumeParser()._extract_text_from_plaintext(content) == "Jane Doe\nEngineer"
+
+
+def test_utf16_with_bom_is_decoded() -> None:
+    content = "Renée Dupont".encode("utf-16")
+
+    assert ResumeParser()._extract_text_from_plaintext(content) == "Renée Dupont"
+
+
+def test_windows_smart_quotes_use_cp1252() -> None:
+    content = "“Led” the team".encode("cp1252")
+
+    assert ResumeParser()._extract_text_from_plaintext(content) == "“Led” the team"
+
+
+def test_undefined_cp1252_bytes_fall_back_to_latin1() -> None:
+    assert ResumeParser()._extract_text_from_plaintext(b"caf\xe9 \x81") == "caf\xe9 \x81"
@@ -10,7 +10,11 @@ from app.utils.redis_cache import (
     RedisClient,
     CacheStatus,
     get_cached,
+    get_cached_json,
+    get_cached_json_with_ttl,
+    get_cached_model,
     set_cached,
+    set_cached_compressed,
     invalidate_cache,
     get_cache_health,
     generate_cache_key,
@@ -136,6 +140,28 @@ class TestCacheOperations:
             assert result == {"data": "cached_value"}
             mock_client.record_success.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_cached_model_validates_stored_json(self):
+        """Test cached JSON is validated straight into the model; mismatches are a miss."""
+        from app.models.cover_letter import CoverLetterResponse
+        
+        mock_redis = AsyncMock()
+        mock_redis.get.side_effect = [
+            json.dumps({"success": True, "cover_letter": "Letter", "word_count": 1}),
+            json.dumps({"cover_letter": "missing success flag"}),
+        ]
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            result = await get_cached_model("test_key", CoverLetterResponse)
+            stale = await get_cached_model("test_key", CoverLetterResponse)
+        
+        assert isinstance(result, CoverLetterResponse)
+        assert result.cover_letter == "Letter"
+        assert stale is None
+
     @pytest.mark.asyncio
     async def test_get_cached_failure(self):
         """Test cache get operation handles errors gracefully."""
@@ -152,6 +178,188 @@ class TestCacheOperations:
             assert result is None
             mock_client.record_failure.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_compressed_round_trip(self):
+        """Test values stored compressed are transparently decompressed."""
+        store = {}
+        mock_redis = AsyncMock()
+        mock_redis.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+        mock_redis.get.side_effect = lambda key: store.get(key)
+        mock_redis.ttl.return_value = -2
+        payload = {"cover_letter": "Dear Hiring Manager, " * 50}
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client, \
+             patch('app.utils.redis_cache._zstd_compressor', None):
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            assert await set_cached_compressed("test_key", payload, ttl=60)
+            assert store["test_key"].startswith("z:")
+            assert len(store["test_key"]) < len(json.dumps(payload))
+            
+            result = await get_cached("test_key")
+            
+            assert result == payload
+
+    @pytest.mark.asyncio
+    async def test_zstd_compressed_round_trip(self):
+        """Test zstd is preferred when installed and zlib entries still load."""
+        pytest.importorskip("zstandard")
+        from app.utils.redis_cache import _compress_value
+        
+        store = {}
+        mock_redis = AsyncMock()
+        mock_redis.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+        mock_redis.get.side_effect = lambda key: store.get(key)
+        mock_redis.ttl.return_value = -2
+        payload = {"pdf_base64": "JVBERi0xLjcK" * 200}
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            assert await set_cached_compressed("test_key", payload, ttl=60)
+            assert store["test_key"].startswith("zs:")
+            assert await get_cached("test_key") == payload
+            
+            with patch('app.utils.redis_cache._zstd_compressor', None):
+                store["legacy_key"] = _compress_value(json.dumps(payload))
+            assert store["legacy_key"].startswith("z:")
+            assert await get_cached("legacy_key") == payload
+
+    @pytest.mark.asyncio
+    async def test_zstd_entry_without_zstandard_is_miss(self):
+        """Test zstd entries are a miss, not a Redis failure, without zstandard."""
+        mock_redis = AsyncMock()
+        mock_redis.get.return_value = "zs:KLUv/QBYCQAAe30="
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client, \
+             patch('app.utils.redis_cache._zstd_decompressor', None):
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            assert await get_cached("test_key") is None
+            mock_client.record_failure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_cached_serializes_pydantic_model(self):
+        """Test models are stored as the same JSON as model_dump(mode='json')."""
+        from app.models.cover_letter import CoverLetterResponse
+        
+        mock_redis = AsyncMock()
+        mock_redis.ttl.return_value = -2
+        response = CoverLetterResponse(
+            success=True,
+            cover_letter="Letter",
+            word_count=1,
+            model_used="model",
+            profile_fields_used=["skills"],
+        )
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            assert await set_cached("test_key", response, ttl=60)
+            
+            stored = mock_redis.set.call_args[0][1]
+            assert json.loads(stored) == response.model_dump(mode="json")
+
+    @pytest.mark.asyncio
+    async def test_set_cached_by_alias_and_get_cached_json(self):
+        """Test by_alias stores the API wire format, returned verbatim."""
+        from app.models.resume import ResumeResponse
+        
+        mock_redis = AsyncMock()
+        mock_redis.ttl.return_value = -2
+        response = ResumeResponse(success=True, pdf_base64="pdf")
+        
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+            
+            assert await set_cached("test_key", response, ttl=60, by_alias=True)
+            
+            stored = mock_redis.set.call_args[0][1]
+            assert stored == response.model_dump_json(by_alias=True)
+            
+            mock_redis.get.return_value = stored
+            assert await get_cached_json("test_key") == stored
+
+
+    @pytest.mark.asyncio
+    async def test_set_cached_pipelines_index_writes(self):
+        """Test namespaced keys write entry, index and TTL read in one pipeline."""
+        class FakePipeline:
+            def __init__(self):
+                self.commands = []
+                self.set = lambda *a, **kw: self.commands.append("set")
+                self.sadd = lambda *a: self.commands.append("sadd")
+                self.ttl = lambda *a: self.commands.append("ttl")
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self):
+                return [True, 1, -1]
+
+        pipe = FakePipeline()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
+        mock_redis.expire = AsyncMock()
+        key = generate_cache_key("user-1", "job description", "cover")
+
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+
+            assert await set_cached(key, {"data": "x"}, ttl=60)
+
+        assert pipe.commands == ["set", "sadd", "ttl"]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        # New index set has no expiry yet, so it gets one
+        mock_redis.expire.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_cached_json_with_ttl_single_round_trip(self):
+        """Test the value and its remaining TTL come back from one pipeline."""
+        class FakePipeline:
+            def __init__(self):
+                self.commands = []
+                self.get = lambda *a: self.commands.append("get")
+                self.ttl = lambda *a: self.commands.append("ttl")
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def execute(self):
+                return ['{"data": "x"}', 42]
+
+        pipe = FakePipeline()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = pipe
+
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = True
+            mock_client.get_client = AsyncMock(return_value=mock_redis)
+
+            assert await get_cached_json_with_ttl("test_key") == ('{"data": "x"}', 42)
+
+        assert pipe.commands == ["get", "ttl"]
+
+    @pytest.mark.asyncio
+    async def test_get_cached_json_with_ttl_when_unavailable(self):
+        """Test an unavailable cache reports a missing key."""
+        with patch('app.utils.redis_cache.redis_client') as mock_client:
+            mock_client.is_available = False
+            assert await get_cached_json_with_ttl("test_key") == (None, -2)
+
 
 class TestCacheKeyGeneration:
     """Tests for cache key generation."""
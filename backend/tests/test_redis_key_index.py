@@ -33,3 +33,11 @@ def test_index_set_key_format() -> None:
 
 def test_reject_non_namespaced_keys() -> None:
     assert parse_cache_key_parts("other:app:key:x") is None
+
+
+def test_generate_cache_key_hash_shape() -> None:
+    _ns, _prefix, _user, jd_hash = parse_cache_key_parts(
+        generate_cache_key("abc", "jd text " * 500, "resume")
+    )
+    assert len(jd_hash) == 16
+    int(jd_hash, 16)
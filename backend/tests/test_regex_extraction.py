@@ -0,0 +1,62 @@
+"""
+Tests for the regex fallback extractor used when the LLM is unavailable.
+"""
+
+from __future__ import annotations
+
+from app.services.resume_parser import ResumeParser, _truncate_for_prompt
+
+
+SAMPLE_RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 123-4567
+Senior engineer building data platforms.
+
+Technical Skills: Python, Go, Kubernetes | PostgreSQL; Python
+Experience:
+Acme Corp
+"""
+
+
+def test_regex_extract_contact_and_skills() -> None:
+    result = ResumeParser()._regex_extract(SAMPLE_RESUME)
+
+    assert result["name"] == "Jane Doe"
+    assert result["email"] == "jane.doe@example.com"
+    assert "555" in result["phone"] and "4567" in result["phone"]
+    assert result["skills"] == ["Python", "Go", "Kubernetes", "PostgreSQL"]
+
+
+def test_regex_extract_without_matches() -> None:
+    result = ResumeParser()._regex_extract("lowercase heading\nnothing useful here")
+
+    assert result["name"] is None
+    assert result["email"] is None
+    assert result["phone"] is None
+    assert result["skills"] == []
+
+
+def test_email_found_past_non_email_at_signs() -> None:
+    text = "Follow @janedoe on socials. " + "filler " * 500 + "Contact: jane.doe@example.com"
+
+    assert ResumeParser()._regex_extract(text)["email"] == "jane.doe@example.com"
+    assert ResumeParser()._extract_contact_fields(text)["email"] == "jane.doe@example.com"
+
+
+def test_phone_prefix_before_first_digit_is_kept() -> None:
+    text = "Jane Doe\nPhone: +44 20 7946 0958\n" + "experience " * 50
+
+    assert ResumeParser()._extract_contact_fields(text)["phone"] == "+44 20 7946 0958"
+
+
+def test_truncate_for_prompt_cuts_at_word_boundary() -> None:
+    text = "alpha beta gamma delta"
+
+    assert _truncate_for_prompt(text, 100) == text
+    assert _truncate_for_prompt(text, 13) == "alpha beta"
+    assert _truncate_for_prompt("x" * 20, 8) == "x" * 8
+
+
+def test_truncate_for_prompt_prefers_nearby_line_break() -> None:
+    text = "Led the platform team.\n" + "word " * 40
+
+    assert _truncate_for_prompt(text, 60) == "Led the platform team."
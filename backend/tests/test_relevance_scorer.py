@@ -325,4 +325,20 @@ def test_scorer_empty_jd_not_cached():
 
     # Empty JD should still work (may or may not be cached, but shouldn't crash)
     assert scorer1.jd_tokens == []
-    assert scorer2.jd_tokens == []
\ No newline at end of file
+    assert scorer2.jd_tokens == []
+
+
+def test_scorer_cache_evicts_least_recently_used():
+    """A recently reused job description survives eviction (LRU, not FIFO)."""
+    RelevanceScorer.clear_cache()
+
+    hot = RelevanceScorer("Hot posting: Python Developer")
+    for i in range(RelevanceScorer._cache_max_size - 1):
+        RelevanceScorer(f"One-off job description {i}")
+
+    # Touch the hot JD, then overflow the cache by one entry
+    assert RelevanceScorer("Hot posting: Python Developer") is hot
+    RelevanceScorer("One more job description")
+
+    assert hot._cache_key in RelevanceScorer.get_cache_stats()["cache_keys"]
+    assert RelevanceScorer("Hot posting: Python Developer") is hot
@@ -213,7 +213,7 @@ async def test_get_stats(deduplicator):
     assert stats["in_flight_count"] == 1
     assert stats["ttl_seconds"] == 2.0
     assert len(stats["requests"]) == 1
-    # Key format is "prefix:hash" where hash is first 16 chars of SHA256
+    # Key format is "prefix:hash" where hash is a 16-hex-char (8-byte) BLAKE2b digest
     assert stats["requests"][0]["key"].startswith("test:")
     assert len(stats["requests"][0]["key"]) == len("test:") + 16  # prefix + 16-char hash
 
@@ -286,4 +286,11 @@ async def test_sequential_requests_not_deduplicated(deduplicator):
 
     assert result1 == 10
     assert result2 == 10
-    assert call_count == 2  # Called twice because they're sequential
\ No newline at end of file
+    assert call_count == 2  # Called twice because they're sequential
+
+
+def test_generate_request_hash_separates_fields(deduplicator):
+    """Test that argument boundaries and types are part of the hash."""
+
+    assert deduplicator._generate_request_hash("ab", "c") != deduplicator._generate_request_hash("a", "bc")
+    assert deduplicator._generate_request_hash("1") != deduplicator._generate_request_hash(1)
@@ -1,8 +1,12 @@
 
+import asyncio
+import threading
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from datetime import datetime
-from app.services.resume_compiler import ResumeCompiler
+from app.services.resume_compiler import ResumeCompiler, _REFRESH_TASKS
+from app.models.resume import ResumeResponse
 from app.models.user import UserProfile, Experience, Project, Education, Skill, UserSettings
 
 @pytest.fixture
@@ -60,9 +64,9 @@ def mock_pdf_generator():
 
 @pytest.fixture
 def mock_cache():
-    with patch("app.services.resume_compiler.get_cached") as mock_get, \
+    with patch("app.services.resume_compiler.get_cached_model_with_ttl") as mock_get, \
          patch("app.services.resume_compiler.set_cached") as mock_set:
-        mock_get.return_value = None
+        mock_get.return_value = (None, -2)
         yield mock_get, mock_set
 
 @pytest.fixture
@@ -88,11 +92,13 @@ async def test_compile_resume(compiler, sample_profile, mock_cache):
     mock_get, mock_set = mock_cache
     mock_get.assert_called_once()
     mock_set.assert_called_once()
+    assert mock_set.call_args.kwargs["by_alias"] is True
+    assert mock_set.call_args.kwargs["compress"] is True
 
 @pytest.mark.asyncio
 async def test_compile_cached_resume(compiler, sample_profile, mock_cache):
     mock_get, mock_set = mock_cache
-    mock_get.return_value = {
+    mock_get.return_value = (ResumeResponse(**{
         "success": True,
         "pdf_base64": "cached_pdf",
         "resume_json": {
@@ -106,12 +112,65 @@ async def test_compile_cached_resume(compiler, sample_profile, mock_cache):
             "publications": []
         },
         "error": None
-    }
+    }), compiler.settings.cache_ttl)
     
     response = await compiler.compile(sample_profile, "jd")
     assert response.pdf_base64 == "cached_pdf"
     mock_set.assert_not_called()
 
+@pytest.mark.asyncio
+async def test_scoring_runs_off_event_loop(compiler, sample_profile):
+    loop_thread_id = threading.get_ident()
+    scoring_thread_ids = []
+    original = ResumeCompiler._select_items
+
+    def tracking_select_items(*args):
+        scoring_thread_ids.append(threading.get_ident())
+        return original(*args)
+
+    with patch.object(ResumeCompiler, "_select_items", staticmethod(tracking_select_items)):
+        response = await compiler.compile(sample_profile, "Looking for a Python Developer.")
+
+    assert response.success
+    assert response.resume_json.experiences
+    assert scoring_thread_ids and scoring_thread_ids[0] != loop_thread_id
+
+@pytest.mark.asyncio
+async def test_get_cached_response_json(compiler, sample_profile):
+    wire = ResumeResponse(success=True, pdf_base64="cached_pdf").model_dump_json(by_alias=True)
+    legacy = ResumeResponse(success=True, pdf_base64="cached_pdf").model_dump_json()
+    fresh_ttl = compiler.settings.cache_stale_window + 60
+
+    with patch("app.services.resume_compiler.get_cached_json_with_ttl", AsyncMock(return_value=(wire, fresh_ttl))):
+        assert await compiler.get_cached_response_json(sample_profile, "jd") == wire
+
+    # Entries cached before the by-alias format are not sent to clients
+    with patch("app.services.resume_compiler.get_cached_json_with_ttl", AsyncMock(return_value=(legacy, fresh_ttl))):
+        assert await compiler.get_cached_response_json(sample_profile, "jd") is None
+
+    with patch("app.services.resume_compiler.get_cached_json_with_ttl", AsyncMock(return_value=(None, -2))):
+        assert await compiler.get_cached_response_json(sample_profile, "jd") is None
+
+@pytest.mark.asyncio
+async def test_stale_hit_is_served_and_refreshed_once(compiler, sample_profile, mock_cache):
+    _, mock_set = mock_cache
+    wire = ResumeResponse(success=True, pdf_base64="stale_pdf").model_dump_json(by_alias=True)
+    stale = AsyncMock(return_value=(wire, 5))
+
+    with patch("app.services.resume_compiler.get_cached_json_with_ttl", stale):
+        first = await compiler.get_cached_response_json(sample_profile, "jd")
+        second = await compiler.get_cached_response_json(sample_profile, "jd")
+        assert first == second == wire
+        assert len(_REFRESH_TASKS) == 1
+        await asyncio.gather(*_REFRESH_TASKS.values())
+
+    assert not _REFRESH_TASKS
+    # The refresh recompiled and stored a new entry with fresh TTL plus stale window
+    mock_set.assert_called_once()
+    settings = compiler.settings
+    assert mock_set.call_args.kwargs["ttl"] == settings.cache_ttl + settings.cache_stale_window
+    assert mock_set.call_args[0][1].pdf_base64 == "base64encodedpdf"
+
 @pytest.mark.asyncio
 async def test_pdf_generation_failure(compiler, sample_profile, mock_pdf_generator, mock_cache):
     # Make the async method raise an exception
@@ -124,8 +183,35 @@ async def test_pdf_generation_failure(compiler, sample_profile, mock_pdf_generat
     assert response.pdf_base64 is None
     assert "PDF Error" in response.error
 
+@pytest.mark.asyncio
+async def test_json_only_skips_pdf(compiler, sample_profile, mock_pdf_generator, mock_cache):
+    mock_pdf_generator.generate_pdf_base64 = AsyncMock(return_value="unused")
+    mock_get, mock_set = mock_cache
+
+    response = await compiler.compile(sample_profile, "jd", output_format="json")
+
+    assert response.success
+    assert response.resume_json is not None
+    assert response.pdf_base64 is None
+    assert response.error is None
+    mock_pdf_generator.generate_pdf_base64.assert_not_called()
+    # JSON-only results are cached apart from full results
+    assert mock_get.call_args[0][0].endswith(":json")
+    assert mock_set.call_args[0][0] == mock_get.call_args[0][0]
+
 def test_get_available_templates(compiler):
     templates = compiler.get_available_templates()
     assert "experience-skills-projects" in templates
     assert "compact-technical" in templates
     assert "description" in templates["experience-skills-projects"]
+
+def test_template_configs_are_read_only(compiler):
+    from app.services.resume_compiler import TEMPLATE_CONFIGS
+
+    with pytest.raises(TypeError):
+        TEMPLATE_CONFIGS["experience-skills-projects"]["max_skills"] = 99
+
+    # Listing templates hands out copies, never the shared configs
+    templates = compiler.get_available_templates()
+    templates["compact-technical"]["max_skills"] = 99
+    assert TEMPLATE_CONFIGS["compact-technical"]["max_skills"] == 15
@@ -2,11 +2,14 @@
 Test shared HTTP client and AsyncGroq client optimizations.
 """
 
+import asyncio
+import httpx
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import app.services.profile_service as profile_service
 import app.services.resume_parser as resume_parser
+import app.services.groq_client as groq_client
 
 
 class TestSharedGroqClient:
@@ -42,11 +45,84 @@ class TestSharedGroqClient:
             
             client = resume_parser.get_groq_client()
             assert client is None
+    
+    @pytest.mark.asyncio
+    async def test_close_groq_client(self):
+        """Test that close_groq_client closes and resets the parser's client."""
+        mock_client = Mock()
+        mock_client.close = AsyncMock()
+        resume_parser._groq_client = mock_client
+        
+        await resume_parser.close_groq_client()
+        
+        mock_client.close.assert_awaited_once()
+        assert resume_parser._groq_client is None
+
+
+class TestSharedGroqClientWrapper:
+    """Tests for the shared GroqClient used by CoverLetterGenerator."""
+    
+    def test_get_groq_client_creates_singleton(self):
+        """Test that get_groq_client returns the same GroqClient."""
+        with patch('app.services.groq_client.get_settings') as mock_settings, \
+             patch('app.services.groq_client.AsyncGroq') as mock_async_groq:
+            mock_settings.return_value.groq_api_key = "test_key"
+            mock_settings.return_value.groq_model = "test-model"
+            
+            # Reset module-level client
+            groq_client._groq_client = None
+            
+            client1 = groq_client.get_groq_client()
+            client2 = groq_client.get_groq_client()
+            assert client1 is client2
+            assert mock_async_groq.call_count == 1
+            
+            groq_client._groq_client = None
+
+    @pytest.mark.asyncio
+    async def test_close_groq_client(self):
+        """Test that close_groq_client closes and resets the shared client."""
+        with patch('app.services.groq_client.get_settings') as mock_settings, \
+             patch('app.services.groq_client.AsyncGroq') as mock_async_groq:
+            mock_settings.return_value.groq_api_key = "test_key"
+            mock_settings.return_value.groq_model = "test-model"
+            mock_async_groq.return_value.close = AsyncMock()
+            
+            groq_client._groq_client = None
+            groq_client.get_groq_client()
+            
+            await groq_client.close_groq_client()
+            
+            mock_async_groq.return_value.close.assert_awaited_once()
+            assert groq_client._groq_client is None
+
+
+    @pytest.mark.asyncio
+    async def test_warm_up_swallows_errors(self):
+        """Test that warm_up lists models and never raises."""
+        with patch('app.services.groq_client.get_settings') as mock_settings, \
+             patch('app.services.groq_client.AsyncGroq') as mock_async_groq:
+            mock_settings.return_value.groq_api_key = "test_key"
+            mock_settings.return_value.groq_model = "test-model"
+            mock_async_groq.return_value.models.list = AsyncMock(
+                side_effect=[Mock(), RuntimeError("unreachable")]
+            )
+            
+            client = groq_client.GroqClient()
+            
+            assert await client.warm_up() is True
+            assert await client.warm_up() is False
 
 
 class TestSharedHTTPClient:
     """Tests for shared HTTP client in profile_service."""
     
+    @pytest.fixture(autouse=True)
+    def _clear_profile_cache(self):
+        profile_service.clear_profile_cache()
+        yield
+        profile_service.clear_profile_cache()
+    
     @pytest.mark.asyncio
     async def test_get_shared_http_client_creates_singleton(self):
         """Test that get_shared_http_client returns the same instance."""
@@ -61,6 +137,24 @@ class TestSharedHTTPClient:
         # Second call returns same client
         client2 = await profile_service.get_shared_http_client()
         assert client1 is client2
+        
+        # Connect / pool stalls fail fast instead of using the read budget
+        assert client1.timeout.connect == 5.0
+        assert client1.timeout.pool == 5.0
+    
+    @pytest.mark.asyncio
+    async def test_get_shared_http_client_skips_lock_when_initialized(self):
+        """Test the steady-state path returns the client without taking the lock."""
+        existing = Mock()
+        lock = Mock()
+        lock.__aenter__ = AsyncMock(side_effect=AssertionError("lock acquired"))
+        lock.__aexit__ = AsyncMock()
+        
+        with patch.object(profile_service, '_http_client', existing), \
+             patch.object(profile_service, '_http_client_lock', lock):
+            assert await profile_service.get_shared_http_client() is existing
+        
+        lock.__aenter__.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_close_shared_http_client(self):
@@ -98,3 +192,132 @@ class TestSharedHTTPClient:
         # Service should be closed after context exit
         # (but shared client should remain)
         assert profile_service._http_client is not None
+    
+    @pytest.fixture
+    def frontend(self):
+        """
+        Point the shared HTTP client at canned frontend responses.
+        
+        Call it with the ``(status, body)`` pairs successive ``get`` calls
+        return; ``wait`` is awaited before each response is handed back.
+        """
+        mock_client = Mock()
+        
+        def respond(responses, path="/api/profile", wait=None):
+            request = httpx.Request("GET", f"http://frontend{path}")
+            queue = [httpx.Response(status, content=body, request=request) for status, body in responses]
+            
+            async def get(*args, **kwargs):
+                if wait is not None:
+                    await wait()
+                return queue.pop(0)
+            
+            mock_client.get = AsyncMock(side_effect=get)
+            return mock_client
+        
+        with patch('app.services.profile_service.get_shared_http_client', AsyncMock(return_value=mock_client)):
+            yield respond
+    
+    @pytest.mark.asyncio
+    async def test_get_profile_validates_raw_json(self, frontend):
+        """Test get_profile validates the response bytes and rejects bad shapes."""
+        service = profile_service.ProfileService()
+        frontend([
+            (200, b'{"id": "u1", "email": "u1@example.com", "skills": []}'),
+            (200, b'["not", "a", "profile"]'),
+        ])
+        
+        profile = await service.get_profile("token")
+        invalid = await service.get_profile("other-token")
+        
+        assert profile.id == "u1"
+        assert invalid is None
+    
+    @pytest.mark.asyncio
+    async def test_get_profile_caches_validated_body(self, frontend):
+        """Test a repeat fetch is served from cache as a fresh model; failures aren't cached."""
+        service = profile_service.ProfileService()
+        mock_client = frontend([
+            (401, None),
+            (200, b'{"id": "u1", "email": "u1@example.com"}'),
+        ])
+        
+        unauthorized = await service.get_profile("token")
+        first = await service.get_profile("token")
+        second = await service.get_profile("token")
+        
+        assert unauthorized is None
+        assert mock_client.get.await_count == 2
+        assert first.id == second.id == "u1"
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_get_profile_shares_one_request(self, frontend):
+        """Test concurrent fetches for one token hit the API once but get separate models."""
+        service = profile_service.ProfileService()
+        mock_client = frontend(
+            [(200, b'{"id": "u1", "email": "u1@example.com"}')],
+            wait=lambda: asyncio.sleep(0.01),
+        )
+        
+        first, second = await asyncio.gather(
+            service.get_profile("token"),
+            service.get_profile("token"),
+        )
+        
+        assert mock_client.get.await_count == 1
+        assert first.id == second.id == "u1"
+        assert first is not second
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_get_profile_does_not_fail_other_callers(self, frontend):
+        """Test a cancelled caller neither cancels nor fails the shared fetch."""
+        service = profile_service.ProfileService()
+        started = asyncio.Event()
+        release = asyncio.Event()
+        
+        async def hold():
+            started.set()
+            await release.wait()
+        
+        mock_client = frontend([(200, b'{"id": "u1", "email": "u1@example.com"}')], wait=hold)
+        
+        leader = asyncio.create_task(service.get_profile("token"))
+        await started.wait()
+        follower = asyncio.create_task(service.get_profile("token"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+        profile = await follower
+        
+        assert leader.cancelled()
+        assert profile.id == "u1"
+        assert mock_client.get.await_count == 1
+        assert profile_service._inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_validate_token_parses_session_bytes(self, frontend):
+        """Test validate_token reads the user id and treats a null session as None."""
+        service = profile_service.ProfileService()
+        frontend(
+            [(200, b'{"user": {"id": "u1"}}'), (200, b'null')],
+            path="/api/auth/session",
+        )
+        
+        user_id = await service.validate_token("token")
+        no_session = await service.validate_token("token")
+        
+        assert user_id == "u1"
+        assert no_session is None
+    
+    @pytest.mark.asyncio
+    async def test_warm_shared_http_client_swallows_errors(self):
+        """Test that the frontend warm-up issues a HEAD and never raises."""
+        mock_client = Mock()
+        mock_client.head = AsyncMock(side_effect=[Mock(), httpx.ConnectError("refused")])
+        
+        with patch('app.services.profile_service.get_shared_http_client', AsyncMock(return_value=mock_client)):
+            assert await profile_service.warm_shared_http_client() is True
+            assert await profile_service.warm_shared_http_client() is False
+        
+        mock_client.head.assert_awaited()
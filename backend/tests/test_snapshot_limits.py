@@ -70,6 +70,14 @@ class TestSnapshotSizeValidator:
         assert len(result["warnings"]) > 0
         assert "large" in result["warnings"][0]
     
+    def test_size_is_compact_utf8_json(self):
+        """Test size is measured on compact UTF-8 JSON, not ASCII-escaped output."""
+        validator = SnapshotSizeValidator()
+        
+        result = validator.validate_snapshot({"name": "José", 1: "x"})
+        
+        assert result["size_bytes"] == len('{"name":"José","1":"x"}'.encode("utf-8"))
+    
     def test_validate_long_arrays(self):
         """Test validation of snapshots with long arrays."""
         validator = SnapshotSizeValidator(max_array_length=5)
@@ -39,13 +39,22 @@ class TestThreadPoolOffloading:
         main_thread_id = threading.current_thread().ident
         pdf_thread_id = None
         
+        html_thread_id = None
+        original_generate_html = pdf_generator.PDFGenerator.generate_html
+        
+        def tracking_generate_html(self, resume):
+            nonlocal html_thread_id
+            html_thread_id = threading.current_thread().ident
+            return original_generate_html(self, resume)
+        
         def mock_generate_sync(self, html_content, max_pages=1):
             nonlocal pdf_thread_id
             pdf_thread_id = threading.current_thread().ident
             # Return minimal PDF bytes
             return b"%PDF-1.4 mock pdf"
         
-        with patch.object(pdf_generator.PDFGenerator, '_generate_pdf_sync', mock_generate_sync):
+        with patch.object(pdf_generator.PDFGenerator, '_generate_pdf_sync', mock_generate_sync), \
+             patch.object(pdf_generator.PDFGenerator, 'generate_html', tracking_generate_html):
             with patch.object(pdf_generator, 'HTML') as mock_html:
                 # Set up mocks to avoid actual WeasyPrint calls
                 mock_doc = MagicMock()
@@ -70,9 +79,10 @@ class TestThreadPoolOffloading:
                 
                 asyncio.run(test_generation())
         
-        # Verify PDF was generated in a different thread
+        # Verify PDF (and its HTML templating) ran in a different thread
         assert pdf_thread_id is not None
         assert pdf_thread_id != main_thread_id
+        assert html_thread_id == pdf_thread_id
         print(f"Main thread: {main_thread_id}, PDF thread: {pdf_thread_id}")
         print("✓ PDF generation runs in separate thread (not blocking event loop)")
     
@@ -154,6 +164,24 @@ class TestThreadPoolOffloading:
         assert executor1 is executor2
         print("✓ Thread pool executor is properly singleton")
 
+    
+    def test_warm_up_renders_in_thread_pool(self):
+        """Test the startup warm-up renders off the event loop and never raises."""
+        from app.utils import pdf_generator
+        
+        main_thread_id = threading.current_thread().ident
+        render_thread_ids = []
+        
+        def fake_render():
+            render_thread_ids.append(threading.current_thread().ident)
+            if len(render_thread_ids) > 1:
+                raise OSError("fonts unavailable")
+        
+        with patch.object(pdf_generator, '_render_warm_up_document', fake_render):
+            assert asyncio.run(pdf_generator.warm_up_pdf_generator()) is True
+            assert asyncio.run(pdf_generator.warm_up_pdf_generator()) is False
+        
+        assert main_thread_id not in render_thread_ids
 
 class TestAsyncGroqUsage:
     """Tests for AsyncGroq client usage (non-blocking LLM calls)."""